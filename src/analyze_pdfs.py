@@ -234,21 +234,16 @@ class ZoteroPDFAnalyzer:
             Extracted text as string, or None if extraction failed
         """
         try:
-            # Open PDF from bytes
-            pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
-
             extracted_text = []
 
-            # Extract text from each page
-            for page_num in range(len(pdf_document)):
-                page = pdf_document[page_num]
-                text = page.get_text()
-                if text.strip():
-                    extracted_text.append(f"--- Page {page_num + 1} ---\n")
-                    extracted_text.append(text)
-                    extracted_text.append("\n\n")
-
-            pdf_document.close()
+            # Open PDF from bytes and extract text from each page
+            with fitz.open(stream=pdf_content, filetype="pdf") as pdf_document:
+                for page in pdf_document:
+                    text = page.get_text("text", sort=False)
+                    if text and not text.isspace():
+                        extracted_text.append(f"--- Page {page.number + 1} ---\n")
+                        extracted_text.append(text)
+                        extracted_text.append("\n\n")
 
             return "".join(extracted_text) if extracted_text else None
 
@@ -8,16 +8,91 @@ including attachment detection, note creation, and verbose output.
 Supports optional local caching for offline operation and reduced API calls.
 """
 
+import os
+import threading
 import markdown
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pyzotero import zotero
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator, Tuple
 
 from .zotero_cache import ZoteroCache
 
+# Optional Resiliparse support (faster HTML-to-text for note bodies)
+try:
+    from resiliparse.extract.html2text import extract_plain_text
+    from resiliparse.parse.html import HTMLTree
+    _HAS_RESILIPARSE = True
+except ImportError:
+    extract_plain_text = None
+    HTMLTree = None
+    _HAS_RESILIPARSE = False
+
+# lxml ships with python-docx and Trafilatura; used for note HTML-to-text
+# when Resiliparse is not installed (much faster than a BeautifulSoup tree)
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+
+# Extractable attachment types by MIME type and by filename extension
+# (python-docx only supports .docx, but legacy .doc is still routed to it)
+_ATTACHMENT_TYPES_BY_MIME = {
+    'text/html': 'HTML',
+    'application/xhtml+xml': 'HTML',
+    'application/pdf': 'PDF',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'DOCX',
+    'application/msword': 'DOCX',
+    'text/plain': 'TXT',
+}
+_ATTACHMENT_TYPES_BY_EXTENSION = {
+    '.html': 'HTML',
+    '.htm': 'HTML',
+    '.pdf': 'PDF',
+    '.docx': 'DOCX',
+    '.doc': 'DOCX',
+    '.txt': 'TXT',
+}
+
+
+# Markdown converters are stateful, so each thread keeps its own
+_markdown_local = threading.local()
+
+
+@lru_cache(maxsize=128)
+def _render_markdown(markdown_content: str) -> str:
+    """
+    Convert markdown to note HTML (memoized).
+
+    Repeated bodies (project note templates, placeholder summaries) skip the
+    markdown parse; the cache is bounded so large notes don't pin memory.
+    Misses reuse a per-thread converter instead of rebuilding the extension
+    set on every call.
+    """
+    converter = getattr(_markdown_local, 'converter', None)
+    if converter is None:
+        converter = markdown.Markdown(extensions=['extra', 'nl2br', 'sane_lists'])
+        _markdown_local.converter = converter
+    return converter.reset().convert(markdown_content)
 
 class ZoteroBaseProcessor:
     """Base class for processing Zotero collections with shared functionality."""
 
+    # Concurrent attachment downloads during sync
+    ATTACHMENT_DOWNLOAD_WORKERS = 4
+
+    # Items per API page when streaming collection items
+    ITEMS_PAGE_SIZE = 100
+
+    # Background threads prefetching collection pages (each keeps one
+    # pyzotero client for the life of the processor, see _thread_zot)
+    PAGE_FETCH_WORKERS = 4
+
+    # Attachment types in extraction priority order (see classify_attachment)
+    ATTACHMENT_PRIORITY = ("HTML", "PDF", "DOCX", "TXT")
+
     def __init__(
         self,
         library_id: str,
@@ -42,6 +117,17 @@ class ZoteroBaseProcessor:
         """
         self.library_id = library_id
         self.zot = zotero.Zotero(library_id, library_type, api_key)
+        # pyzotero keeps per-request state on the client, so other threads
+        # get clients of their own (see _thread_zot)
+        self._zot_credentials = (library_id, library_type, api_key)
+        self._zot_thread_id = threading.get_ident()
+        self._zot_local = threading.local()
+
+        # Shared by every _iter_collection_item_pages call, so page prefetches
+        # reuse the same threads (and their clients) instead of new ones each time
+        self._page_fetcher = ThreadPoolExecutor(
+            max_workers=self.PAGE_FETCH_WORKERS, thread_name_prefix='zotero-pages'
+        )
         self.verbose = verbose
 
         # Cache configuration
@@ -50,10 +136,46 @@ class ZoteroBaseProcessor:
         self.offline = offline
         self._caches: Dict[str, ZoteroCache] = {}  # Per-collection caches
 
+        # Convert note HTML to text with Resiliparse when it's installed
+        # (set False to fall back to lxml, or BeautifulSoup without it)
+        self.use_resiliparse = _HAS_RESILIPARSE
+
+        # Attachment lists per parent item for this run (only notes are created
+        # under items, so these don't go stale)
+        self._attachments_memo: Dict[str, List[Dict]] = {}
+
+        # Subcollection keys by (parent key, name) for this run; only found
+        # keys are kept, since a missing subcollection may be created later
+        self._subcollection_keys: Dict[Tuple[str, str], str] = {}
+
+        # Note titles by (note key, version) -> (note HTML, title); see get_note_title
+        self._note_titles: Dict[Tuple[str, Optional[int]], Tuple[str, str]] = {}
+
     # =========================================================================
     # Cache Management
     # =========================================================================
 
+    def _thread_zot(self) -> zotero.Zotero:
+        """
+        Get a pyzotero client that is safe to use on the calling thread.
+
+        pyzotero stores each request's parameters, response and paging links
+        on the client (url_params, request, links), so two threads sharing one
+        client can read each other's parameters or results. The thread that
+        created this processor uses self.zot; any other thread gets a client
+        of its own, built on first use and reused for its later calls.
+
+        Returns:
+            pyzotero client for the current thread
+        """
+        if threading.get_ident() == self._zot_thread_id:
+            return self.zot
+        client = getattr(self._zot_local, 'client', None)
+        if client is None:
+            client = zotero.Zotero(*self._zot_credentials)
+            self._zot_local.client = client
+        return client
+
     def _get_cache(self, collection_key: str) -> Optional[ZoteroCache]:
         """Get or create cache for a collection."""
         if not self.enable_cache:
@@ -213,30 +335,47 @@ class ZoteroBaseProcessor:
                 attachment_count = 0
                 skipped_count = 0
 
-                for i, item in enumerate(unique_items):
-                    item_key = item['key']
-                    children = cache.get_item_children(item_key) or []
-                    attachments = [
-                        c for c in children
-                        if c['data'].get('itemType') == 'attachment'
-                    ]
-
-                    for att in attachments:
-                        att_key = att['key']
-                        if cache.has_attachment_file(att_key):
-                            skipped_count += 1
-                            continue
-
-                        try:
-                            content = self.zot.file(att_key)
-                            cache.store_attachment_file(att_key, content, att['data'])
-                            attachment_count += 1
-                        except Exception as e:
-                            if self.verbose:
-                                print(f"   Warning: Could not download {att_key}: {e}")
-
-                    if progress_callback:
-                        progress_callback(i + 1, len(unique_items), "attachments")
+                # Downloads run on worker threads while this thread writes finished
+                # ones to the cache; the window bounds how many files are in memory.
+                in_flight = deque()
+
+                def download_file(attachment_key: str) -> bytes:
+                    return self._thread_zot().file(attachment_key)
+
+                def store_oldest():
+                    nonlocal attachment_count
+                    future, att = in_flight.popleft()
+                    try:
+                        content = future.result()
+                        cache.store_attachment_file(att['key'], content, att['data'])
+                        attachment_count += 1
+                    except Exception as e:
+                        if self.verbose:
+                            print(f"   Warning: Could not download {att['key']}: {e}")
+
+                with ThreadPoolExecutor(max_workers=self.ATTACHMENT_DOWNLOAD_WORKERS) as executor:
+                    for i, item in enumerate(unique_items):
+                        item_key = item['key']
+                        children = cache.get_item_children(item_key) or []
+                        attachments = [
+                            c for c in children
+                            if c['data'].get('itemType') == 'attachment'
+                        ]
+
+                        for att in attachments:
+                            if cache.has_attachment_file(att['key']):
+                                skipped_count += 1
+                                continue
+
+                            in_flight.append((executor.submit(download_file, att['key']), att))
+                            if len(in_flight) > self.ATTACHMENT_DOWNLOAD_WORKERS:
+                                store_oldest()
+
+                        if progress_callback:
+                            progress_callback(i + 1, len(unique_items), "attachments")
+
+                    while in_flight:
+                        store_oldest()
 
                 print(f"   Downloaded {attachment_count} attachments ({skipped_count} already cached)")
 
@@ -411,6 +550,137 @@ class ZoteroBaseProcessor:
             print("\nTip: Run with --list-collections to see available collections")
             return []
 
+    def get_collection_item_columns(self, collection_key: str) -> Dict[str, List]:
+        """
+        Get key, title, item type and URL of each top-level item as parallel lists.
+
+        For callers that only filter on these fields: a cached collection is
+        read without decoding every item's JSON.
+
+        Args:
+            collection_key: The key of the collection
+
+        Returns:
+            Dict of equal-length lists 'keys', 'titles', 'item_types', 'urls'
+        """
+        cache = self._get_cache(collection_key)
+        if cache:
+            columns = cache.get_collection_item_columns(collection_key)
+            if columns is not None:
+                return columns
+
+        items = self.get_collection_items(collection_key)
+        return {
+            'keys': [item['key'] for item in items],
+            'titles': [item['data'].get('title', '') for item in items],
+            'item_types': [item['data'].get('itemType', '') for item in items],
+            'urls': [item['data'].get('url', '') for item in items],
+        }
+
+    def iter_collection_items(self, collection_key: str) -> Iterator[Dict]:
+        """
+        Iterate over top-level items in a collection, one API page at a time.
+
+        Unlike get_collection_items(), items are yielded as each page arrives
+        instead of after the whole collection has been downloaded.
+
+        Args:
+            collection_key: The key of the collection to process
+
+        Yields:
+            Top-level items in the collection (no attachments/notes)
+
+        Raises:
+            Exception: If a page fails after earlier pages were yielded (a
+                failure before any items arrive still ends the listing empty)
+        """
+        # Check cache first
+        cache = self._get_cache(collection_key)
+        if cache:
+            cached_items = cache.get_collection_items(collection_key)
+            if cached_items is not None:
+                self._log_cache(f"Cache hit: {len(cached_items)} items from collection {collection_key}")
+                yield from cached_items
+                return
+
+        if self.offline:
+            print(f"Error: Collection {collection_key} not in cache (offline mode)")
+            return
+
+        fetched = [] if cache else None
+        yielded = False
+        try:
+            for page in self._iter_collection_item_pages(collection_key):
+                yield from page
+                yielded = yielded or bool(page)
+                if fetched is not None:
+                    fetched.extend(page)
+        except Exception as e:
+            print(f"Error fetching collection items: {e}")
+            # Once items have been yielded, stopping here would pass off a
+            # partial listing as the whole collection
+            if yielded:
+                raise
+            return
+
+        # Store complete listing in cache
+        if cache:
+            cache.store_items(fetched, collection_key)
+
+    def _iter_collection_item_pages(
+        self,
+        collection_key: str,
+        top_level: bool = True,
+        **params
+    ) -> Iterator[List[Dict]]:
+        """
+        Fetch a collection's items from the API, one page at a time (no cache).
+
+        Pages are fetched on the processor's page-fetch threads, so the next
+        page downloads while the caller works through the current one. Those
+        threads keep their own pyzotero clients (see _thread_zot) and never
+        use self.zot: pyzotero keeps each request's parameters, response and
+        paging links on the client, and per-thread clients are what make
+        paging several collections from different threads at once safe.
+        Paging uses explicit start/limit rather than zot.follow()/everything(),
+        which read those shared links.
+
+        Args:
+            collection_key: The key of the collection
+            top_level: If True, list top-level items only; otherwise include
+                child notes and attachments
+            **params: Extra API filters (e.g. itemType='note')
+
+        Yields:
+            Lists of up to ITEMS_PAGE_SIZE items
+
+        Raises:
+            Exception: Any API error from pyzotero
+        """
+        page_size = self.ITEMS_PAGE_SIZE
+
+        def fetch_page(start: int) -> List[Dict]:
+            client = self._thread_zot()
+            list_items = client.collection_items_top if top_level else client.collection_items
+            return list_items(collection_key, start=start, limit=page_size, **params)
+
+        pending = self._page_fetcher.submit(fetch_page, 0)
+        try:
+            start = 0
+            while True:
+                page = pending.result()
+                if len(page) < page_size:
+                    yield page
+                    break
+
+                # Request the next page before handing this one to the caller
+                start += len(page)
+                pending = self._page_fetcher.submit(fetch_page, start)
+                yield page
+        finally:
+            # Don't wait on a prefetch that's no longer needed
+            pending.cancel()
+
     def get_item_children(self, item_key: str, collection_key: Optional[str] = None) -> List[Dict]:
         """
         Get all child items for a specific parent item.
@@ -453,6 +723,22 @@ class ZoteroBaseProcessor:
 
         return children
 
+    def prefetch_item_children(self, item_keys: List[str], collection_key: str):
+        """
+        Load cached children for many items at once, ahead of per-item lookups.
+
+        Summary-note checks and attachment lookups call get_item_children once
+        per item; prefetching turns those into session-cache hits instead of one
+        database query each.
+
+        Args:
+            item_keys: Parent item keys
+            collection_key: Collection whose cache to read
+        """
+        cache = self._get_cache(collection_key)
+        if cache and item_keys:
+            cache.get_children_bulk(item_keys)
+
     def get_item_attachments(self, item_key: str) -> List[Dict]:
         """
         Get all attachments for a specific item (excludes notes).
@@ -463,12 +749,15 @@ class ZoteroBaseProcessor:
         Returns:
             List of attachment items (only actual file attachments, not notes)
         """
-        children = self.get_item_children(item_key)
-        # Filter to only attachment items (excludes notes and other child types)
-        attachments = [
-            child for child in children
-            if child['data'].get('itemType') == 'attachment'
-        ]
+        attachments = self._attachments_memo.get(item_key)
+        if attachments is None:
+            children = self.get_item_children(item_key)
+            # Filter to only attachment items (excludes notes and other child types)
+            attachments = [
+                child for child in children
+                if child['data'].get('itemType') == 'attachment'
+            ]
+            self._attachments_memo[item_key] = attachments
         return attachments
 
     def print_child_items(self, item_key: str):
@@ -570,6 +859,29 @@ class ZoteroBaseProcessor:
                                  'application/msword'] or
                 filename.lower().endswith(('.docx', '.doc')))
 
+    def classify_attachment(self, attachment: Dict) -> Optional[str]:
+        """
+        Classify an attachment by content type and filename in one pass.
+
+        Equivalent to checking is_html/pdf/docx/txt_attachment in priority
+        order: when the MIME type and extension disagree, the higher-priority
+        type wins.
+
+        Args:
+            attachment: The attachment item data
+
+        Returns:
+            "HTML", "PDF", "DOCX" or "TXT", or None if not extractable
+        """
+        content_type = attachment['data'].get('contentType', '')
+        filename = attachment['data'].get('filename', '')
+
+        by_mime = _ATTACHMENT_TYPES_BY_MIME.get(content_type)
+        by_extension = _ATTACHMENT_TYPES_BY_EXTENSION.get(os.path.splitext(filename)[1].lower())
+        if by_mime and by_extension:
+            return min(by_mime, by_extension, key=self.ATTACHMENT_PRIORITY.index)
+        return by_mime or by_extension
+
     def download_attachment(
         self,
         attachment_key: str,
@@ -610,7 +922,7 @@ class ZoteroBaseProcessor:
         try:
             if self.verbose:
                 print(f"  📥 Downloading attachment from Zotero...")
-            file_content = self.zot.file(attachment_key)
+            file_content = self._thread_zot().file(attachment_key)
 
             # Store in cache
             if collection_key and attachment_data:
@@ -743,11 +1055,7 @@ class ZoteroBaseProcessor:
         """
         try:
             # Convert markdown to HTML with extensions
-            html_content = markdown.markdown(
-                markdown_content,
-                extensions=['extra', 'nl2br', 'sane_lists']
-            )
-            return html_content
+            return _render_markdown(markdown_content)
         except Exception as e:
             print(f"  ⚠️  Warning: Markdown conversion failed: {e}")
             # Fall back to simple newline-to-br replacement
@@ -823,6 +1131,10 @@ class ZoteroBaseProcessor:
         Returns:
             Subcollection key or None if not found
         """
+        memo_key = (parent_collection_key, subcollection_name)
+        if memo_key in self._subcollection_keys:
+            return self._subcollection_keys[memo_key]
+
         # Check cache first
         cache = self._get_cache(parent_collection_key)
         if cache:
@@ -830,6 +1142,7 @@ class ZoteroBaseProcessor:
             for coll in subcollections:
                 if coll['data']['name'] == subcollection_name:
                     self._log_cache(f"Cache hit: subcollection {subcollection_name}")
+                    self._subcollection_keys[memo_key] = coll['key']
                     return coll['key']
             # If cache exists but subcollection not found, might be not synced
             # Fall through to API if not offline
@@ -846,12 +1159,27 @@ class ZoteroBaseProcessor:
                     # Store in cache
                     if cache:
                         cache.store_collection(coll)
+                    self._subcollection_keys[memo_key] = coll['key']
                     return coll['key']
             return None
         except Exception as e:
             print(f"  ❌ Error getting subcollection: {e}")
             return None
 
+    def forget_subcollection(self, subcollection_key: str):
+        """
+        Drop a deleted subcollection from the get_subcollection memo.
+
+        Args:
+            subcollection_key: Key of the deleted subcollection
+        """
+        stale = [
+            memo_key for memo_key, key in self._subcollection_keys.items()
+            if key == subcollection_key
+        ]
+        for memo_key in stale:
+            del self._subcollection_keys[memo_key]
+
     def create_subcollection(self, parent_collection_key: str, subcollection_name: str) -> Optional[str]:
         """
         Create a subcollection inside a parent collection.
@@ -898,6 +1226,7 @@ class ZoteroBaseProcessor:
                     }
                     cache.store_collection(new_collection)
 
+                self._subcollection_keys[(parent_collection_key, subcollection_name)] = new_key
                 return new_key
             else:
                 print(f"  ❌ Failed to create subcollection: {result}")
@@ -981,6 +1310,29 @@ class ZoteroBaseProcessor:
             print(f"  ❌ Error getting collection notes: {e}")
             return []
 
+    def get_note_title(self, note: Dict) -> str:
+        """
+        Get a note item's title, parsing its HTML once per note version.
+
+        Titles are remembered by note key and version, alongside the HTML they
+        came from, so a note edited in place (same version) is parsed again.
+
+        Args:
+            note: Zotero note item
+
+        Returns:
+            Note title
+        """
+        note_html = note['data'].get('note', '')
+        memo_key = (note['key'], note.get('version'))
+        cached = self._note_titles.get(memo_key)
+        if cached is not None and (cached[0] is note_html or cached[0] == note_html):
+            return cached[1]
+
+        title = self.get_note_title_from_html(note_html)
+        self._note_titles[memo_key] = (note_html, title)
+        return title
+
     def get_note_title_from_html(self, note_html: str) -> str:
         """
         Extract title from note HTML (first h1 or first line).
@@ -1014,6 +1366,21 @@ class ZoteroBaseProcessor:
         Returns:
             Plain text content
         """
+        if self.use_resiliparse:
+            # Whole note (no boilerplate removal), one line per block element
+            return extract_plain_text(
+                HTMLTree.parse(note_html),
+                main_content=False,
+                preserve_formatting=True,
+                list_bullets=False
+            ).strip()
+
+        if lxml_html is not None:
+            if not note_html.strip():
+                return ''
+            # Same text as BeautifulSoup's get_text() for note HTML
+            return lxml_html.fromstring(note_html).text_content().strip()
+
         from bs4 import BeautifulSoup
         soup = BeautifulSoup(note_html, 'html.parser')
         return soup.get_text().strip()
@@ -6,14 +6,34 @@ Supports offline operation, delta sync, and prepares for future vector DB integr
 """
 
 import json
+import logging
 import sqlite3
 import hashlib
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import os
 
 
+logger = logging.getLogger(__name__)
+
+
+def _enable_verbose_logging():
+    """Send cache debug messages to stdout with the [Cache] prefix."""
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("[Cache] %(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+
+def _dict_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """sqlite3 row factory that builds plain dicts keyed by column name."""
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+
 class ZoteroCache:
     """
     Local SQLite-based cache for Zotero data.
@@ -28,6 +48,21 @@ class ZoteroCache:
     # Default cache directory in user home
     DEFAULT_CACHE_DIR = os.path.expanduser("~/.zotero_summarizer/cache")
 
+    # File extension for attachments without a filename, keyed by MIME type
+    # (other types fall back to substring matching, see store_attachment_file)
+    EXTENSION_BY_MIME = {
+        'application/pdf': '.pdf',
+        'application/x-pdf': '.pdf',
+        'application/acrobat': '.pdf',
+        'text/pdf': '.pdf',
+        'text/html': '.html',
+        'application/xhtml+xml': '.html',
+        'text/plain': '.txt',
+    }
+
+    # Keys per "IN (...)" query in bulk lookups (stays under SQLite's variable limit)
+    BULK_QUERY_SIZE = 500
+
     def __init__(
         self,
         library_id: str,
@@ -47,6 +82,8 @@ class ZoteroCache:
         self.library_id = library_id
         self.collection_key = collection_key
         self.verbose = verbose
+        if verbose:
+            _enable_verbose_logging()
 
         # Set up cache directory
         self.cache_dir = Path(cache_dir or self.DEFAULT_CACHE_DIR)
@@ -165,10 +202,15 @@ class ZoteroCache:
             """)
             conn.commit()
 
-    def _log(self, message: str):
-        """Log message if verbose mode enabled."""
+    def _log(self, message: str, *args):
+        """
+        Log message if verbose mode enabled.
+
+        Arguments are formatted lazily (logging %-style), so disabled
+        messages cost no string formatting.
+        """
         if self.verbose:
-            print(f"[Cache] {message}")
+            logger.debug(message, *args)
 
     # =========================================================================
     # Sync State Management
@@ -271,7 +313,7 @@ class ZoteroCache:
                  datetime.now().isoformat())
             )
             conn.commit()
-        self._log(f"Stored collection: {name} ({key})")
+        self._log("Stored collection: %s (%s)", name, key)
 
     def store_collections(self, collections: List[Dict]):
         """Store multiple collections."""
@@ -287,7 +329,7 @@ class ZoteroCache:
         # Check session cache first
         cache_key = f"items_{collection_key}"
         if cache_key in self._session_cache:
-            self._log(f"Session cache hit: {cache_key}")
+            self._log("Session cache hit: %s", cache_key)
             return self._session_cache[cache_key]
 
         with sqlite3.connect(self.db_path) as conn:
@@ -303,9 +345,95 @@ class ZoteroCache:
 
             items = [json.loads(row[0]) for row in rows]
             self._session_cache[cache_key] = items
-            self._log(f"Loaded {len(items)} items from DB for collection {collection_key}")
+            self._log("Loaded %s items from DB for collection %s", len(items), collection_key)
             return items
 
+    def get_collection_item_columns(self, collection_key: str) -> Optional[Dict[str, List]]:
+        """
+        Get the commonly filtered fields of a collection's items as parallel lists.
+
+        Fields are read with json_extract in SQLite, so item JSON isn't decoded
+        into dicts in Python (use get_collection_items for full items).
+
+        Args:
+            collection_key: Collection key
+
+        Returns:
+            Dict of equal-length lists 'keys', 'titles', 'item_types', 'urls',
+            or None if the collection isn't cached
+        """
+        # Items already decoded this session: read the fields from them
+        items = self._session_cache.get(f"items_{collection_key}")
+        if items is not None:
+            return {
+                'keys': [item['key'] for item in items],
+                'titles': [item['data'].get('title', '') for item in items],
+                'item_types': [item['data'].get('itemType', '') for item in items],
+                'urls': [item['data'].get('url', '') for item in items],
+            }
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """SELECT i.key,
+                          json_extract(i.data_json, '$.data.title'),
+                          i.item_type,
+                          json_extract(i.data_json, '$.data.url')
+                   FROM items i
+                   JOIN item_collections ic ON i.key = ic.item_key
+                   WHERE ic.collection_key = ?""",
+                (collection_key,)
+            ).fetchall()
+
+        if not rows:
+            return None
+
+        keys, titles, item_types, urls = (list(column) for column in zip(*rows))
+        self._log("Loaded %s item rows (columns only) for collection %s", len(keys), collection_key)
+        return {
+            'keys': keys,
+            'titles': [title or '' for title in titles],
+            'item_types': [item_type or '' for item_type in item_types],
+            'urls': [url or '' for url in urls],
+        }
+
+    def get_subcollection_items(self, parent_key: str, subcollection_names: List[str]) -> List[Dict]:
+        """
+        Get all items in the named subcollections of a parent collection.
+
+        Subcollection names are resolved to keys inside the same query, so this
+        is a single round trip. Items in several of the subcollections are
+        returned once.
+
+        Args:
+            parent_key: Parent collection key
+            subcollection_names: Names of the subcollections to read
+
+        Returns:
+            List of cached items (empty if none match)
+        """
+        if not subcollection_names:
+            return []
+
+        placeholders = ','.join('?' * len(subcollection_names))
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                f"""WITH sc(key) AS (
+                        SELECT key FROM collections
+                        WHERE parent_key = ? AND name IN ({placeholders})
+                    )
+                    SELECT i.data_json FROM items i
+                    WHERE i.key IN (
+                        SELECT ic.item_key FROM item_collections ic
+                        WHERE ic.collection_key IN sc
+                    )""",
+                (parent_key, *subcollection_names)
+            )
+            items = [json.loads(row[0]) for row in cursor.fetchall()]
+
+        self._log("Loaded %s items from %s subcollections of %s",
+                  len(items), len(subcollection_names), parent_key)
+        return items
+
     def get_item(self, item_key: str) -> Optional[Dict]:
         """Get a specific item by key."""
         with sqlite3.connect(self.db_path) as conn:
@@ -357,7 +485,7 @@ class ZoteroCache:
             if collection_key not in collection_keys:
                 collection_keys.append(collection_key)
             self.store_item(item, collection_keys)
-        self._log(f"Stored {len(items)} items for collection {collection_key}")
+        self._log("Stored %s items for collection %s", len(items), collection_key)
 
     # =========================================================================
     # Children (Notes + Attachments) Operations
@@ -368,7 +496,7 @@ class ZoteroCache:
         # Check session cache first
         cache_key = f"children_{item_key}"
         if cache_key in self._session_cache:
-            self._log(f"Session cache hit: {cache_key}")
+            self._log("Session cache hit: %s", cache_key)
             return self._session_cache[cache_key]
 
         with sqlite3.connect(self.db_path) as conn:
@@ -382,9 +510,47 @@ class ZoteroCache:
 
             children = [json.loads(row[0]) for row in rows]
             self._session_cache[cache_key] = children
-            self._log(f"Loaded {len(children)} children for item {item_key}")
+            self._log("Loaded %s children for item %s", len(children), item_key)
             return children
 
+    def get_children_bulk(self, item_keys: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get children for many items with one query per BULK_QUERY_SIZE keys.
+
+        Results are added to the session cache, so later get_item_children
+        calls for these items don't touch the database.
+
+        Args:
+            item_keys: Parent item keys
+
+        Returns:
+            Dict mapping parent key to its cached children (items with no
+            cached children are omitted)
+        """
+        missing = [key for key in item_keys if f"children_{key}" not in self._session_cache]
+
+        loaded: Dict[str, List[Dict]] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(missing), self.BULK_QUERY_SIZE):
+                batch = missing[start:start + self.BULK_QUERY_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                cursor = conn.execute(
+                    f"SELECT parent_key, data_json FROM children WHERE parent_key IN ({placeholders})",
+                    batch
+                )
+                for parent_key, data_json in cursor:
+                    loaded.setdefault(parent_key, []).append(json.loads(data_json))
+
+        for parent_key, children in loaded.items():
+            self._session_cache[f"children_{parent_key}"] = children
+        self._log("Loaded children for %s of %s items in bulk", len(loaded), len(missing))
+
+        return {
+            key: self._session_cache[f"children_{key}"]
+            for key in item_keys
+            if f"children_{key}" in self._session_cache
+        }
+
     def get_child(self, child_key: str) -> Optional[Dict]:
         """Get a specific child by key."""
         with sqlite3.connect(self.db_path) as conn:
@@ -421,7 +587,7 @@ class ZoteroCache:
         """Store multiple children for an item."""
         for child in children:
             self.store_child(child)
-        self._log(f"Stored {len(children)} children for item {parent_key}")
+        self._log("Stored %s children for item %s", len(children), parent_key)
 
     # =========================================================================
     # Attachment File Operations
@@ -453,10 +619,10 @@ class ZoteroCache:
 
             file_path = Path(row[0])
             if not file_path.exists():
-                self._log(f"Attachment file missing: {file_path}")
+                self._log("Attachment file missing: %s", file_path)
                 return None
 
-            self._log(f"Loading attachment from cache: {attachment_key}")
+            self._log("Loading attachment from cache: %s", attachment_key)
             return file_path.read_bytes()
 
     def store_attachment_file(
@@ -479,14 +645,20 @@ class ZoteroCache:
 
         if filename:
             ext = Path(filename).suffix
-        elif 'pdf' in content_type:
-            ext = '.pdf'
-        elif 'html' in content_type:
-            ext = '.html'
-        elif 'text' in content_type:
-            ext = '.txt'
         else:
-            ext = '.bin'
+            # Normalize once ("text/html; charset=utf-8" -> "text/html"), then look up
+            mime = content_type.split(';', 1)[0].strip().lower()
+            ext = self.EXTENSION_BY_MIME.get(mime)
+            if ext is None:
+                # Unlisted variants ("application/vnd.pdf", "text/x-html", ...)
+                if 'pdf' in mime:
+                    ext = '.pdf'
+                elif 'html' in mime:
+                    ext = '.html'
+                elif 'text' in mime:
+                    ext = '.txt'
+                else:
+                    ext = '.bin'
 
         # Store file
         file_path = self.attachments_dir / f"{attachment_key}{ext}"
@@ -507,29 +679,19 @@ class ZoteroCache:
             )
             conn.commit()
 
-        self._log(f"Stored attachment: {filename or attachment_key} ({len(content)} bytes)")
+        self._log("Stored attachment: %s (%s bytes)", filename or attachment_key, len(content))
 
     def get_attachment_metadata(self, attachment_key: str) -> Optional[Dict]:
         """Get attachment file metadata."""
         with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = _dict_row_factory
             cursor = conn.execute(
-                """SELECT filename, content_type, file_path, file_size,
-                          content_hash, downloaded_at
+                """SELECT attachment_key, filename, content_type, file_path,
+                          file_size, content_hash, downloaded_at
                    FROM attachment_files WHERE attachment_key = ?""",
                 (attachment_key,)
             )
-            row = cursor.fetchone()
-            if not row:
-                return None
-            return {
-                'attachment_key': attachment_key,
-                'filename': row[0],
-                'content_type': row[1],
-                'file_path': row[2],
-                'file_size': row[3],
-                'content_hash': row[4],
-                'downloaded_at': row[5]
-            }
+            return cursor.fetchone()
 
     # =========================================================================
     # Cache Invalidation
@@ -553,7 +715,7 @@ class ZoteroCache:
         for k in keys_to_remove:
             self._session_cache.pop(k, None)
 
-        self._log(f"Invalidated item: {item_key}")
+        self._log("Invalidated item: %s", item_key)
 
     def invalidate_child(self, child_key: str):
         """Invalidate cache for a specific child."""
@@ -574,7 +736,7 @@ class ZoteroCache:
         if parent_key:
             self._session_cache.pop(f"children_{parent_key}", None)
 
-        self._log(f"Invalidated child: {child_key}")
+        self._log("Invalidated child: %s", child_key)
 
     def invalidate_children_for_parent(self, parent_key: str):
         """Invalidate all cached children for a parent item."""
@@ -584,7 +746,7 @@ class ZoteroCache:
 
         # Clear session cache
         self._session_cache.pop(f"children_{parent_key}", None)
-        self._log(f"Invalidated children for parent: {parent_key}")
+        self._log("Invalidated children for parent: %s", parent_key)
 
     def invalidate_collection(self, collection_key: str):
         """Invalidate cache for a collection (not items, just membership)."""
@@ -600,7 +762,7 @@ class ZoteroCache:
             conn.commit()
 
         self._session_cache.pop(f"items_{collection_key}", None)
-        self._log(f"Invalidated collection: {collection_key}")
+        self._log("Invalidated collection: %s", collection_key)
 
     def clear_session_cache(self):
         """Clear in-memory session cache."""
@@ -620,7 +782,7 @@ class ZoteroCache:
         self._init_db()
         self._session_cache.clear()
 
-        self._log(f"Cleared all cache data")
+        self._log("Cleared all cache data")
 
     def remove_orphaned_items(self, valid_item_keys: set, collection_key: str = None) -> int:
         """
@@ -675,7 +837,7 @@ class ZoteroCache:
             self._session_cache.pop(k, None)
 
         if removed_count > 0:
-            self._log(f"Removed {removed_count} orphaned items from cache")
+            self._log("Removed %s orphaned items from cache", removed_count)
 
         return removed_count
 
@@ -710,7 +872,7 @@ class ZoteroCache:
         self._session_cache.pop(f"children_{parent_key}", None)
 
         if removed_count > 0:
-            self._log(f"Removed {removed_count} orphaned children for {parent_key}")
+            self._log("Removed %s orphaned children for %s", removed_count, parent_key)
 
         return removed_count
 
@@ -833,7 +995,7 @@ class ZoteroCache:
 
             conn.commit()
 
-        self._log(f"Stored {len(chunks)} chunks for item {item_key}")
+        self._log("Stored %s chunks for item %s", len(chunks), item_key)
         return len(chunks)
 
     def search_vectors(
@@ -867,9 +1029,12 @@ class ZoteroCache:
         query_vec = list(struct.unpack(f'{query_dim}f', query_embedding))
 
         with sqlite3.connect(self.db_path) as conn:
+            # Rows come back as dicts so they can be returned without re-packing
+            conn.row_factory = _dict_row_factory
+
             # Build query with optional filters
             query = """
-                SELECT id, item_key, chunk_index, chunk_text, embedding,
+                SELECT id AS chunk_id, item_key, chunk_index, chunk_text, embedding,
                        page_number, section_id, char_start, char_end,
                        item_type, doc_type
                 FROM vector_chunks
@@ -898,9 +1063,7 @@ class ZoteroCache:
         # Calculate similarities
         results = []
         for row in rows:
-            chunk_id, item_key, chunk_index, chunk_text, embedding_blob, \
-                page_number, section_id, char_start, char_end, \
-                item_type, doc_type = row
+            embedding_blob = row.pop('embedding')
 
             if embedding_blob is None:
                 continue
@@ -909,21 +1072,8 @@ class ZoteroCache:
             chunk_vec = list(struct.unpack(f'{query_dim}f', embedding_blob))
 
             # Calculate cosine similarity
-            similarity = self._cosine_similarity(query_vec, chunk_vec)
-
-            results.append({
-                'chunk_id': chunk_id,
-                'item_key': item_key,
-                'chunk_index': chunk_index,
-                'chunk_text': chunk_text,
-                'page_number': page_number,
-                'section_id': section_id,
-                'char_start': char_start,
-                'char_end': char_end,
-                'item_type': item_type,
-                'doc_type': doc_type,
-                'similarity': similarity
-            })
+            row['similarity'] = self._cosine_similarity(query_vec, chunk_vec)
+            results.append(row)
 
         # Sort by similarity and return top_k
         results.sort(key=lambda x: x['similarity'], reverse=True)
@@ -954,21 +1104,13 @@ class ZoteroCache:
             or None if not indexed
         """
         with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = _dict_row_factory
             cursor = conn.execute(
-                """SELECT chunk_count, content_hash, embedding_model, indexed_at
+                """SELECT item_key, chunk_count, content_hash, embedding_model, indexed_at
                    FROM vector_index_state WHERE item_key = ?""",
                 (item_key,)
             )
-            row = cursor.fetchone()
-            if row:
-                return {
-                    'item_key': item_key,
-                    'chunk_count': row[0],
-                    'content_hash': row[1],
-                    'embedding_model': row[2],
-                    'indexed_at': row[3]
-                }
-            return None
+            return cursor.fetchone()
 
     def is_item_indexed(self, item_key: str) -> bool:
         """Check if an item has been indexed."""
@@ -1001,7 +1143,7 @@ class ZoteroCache:
             conn.execute("DELETE FROM vector_index_state WHERE item_key = ?", (item_key,))
             conn.commit()
 
-        self._log(f"Deleted {count} vectors for item {item_key}")
+        self._log("Deleted %s vectors for item %s", count, item_key)
         return count
 
     def delete_all_vectors(self) -> int:
@@ -1019,7 +1161,7 @@ class ZoteroCache:
             conn.execute("DELETE FROM vector_index_state")
             conn.commit()
 
-        self._log(f"Deleted all {count} vectors")
+        self._log("Deleted all %s vectors", count)
         return count
 
     def get_vector_stats(self) -> Dict:
@@ -302,6 +302,7 @@ Model: {model_used}
         print(f"Step 1: Preparing items for batch processing...\n")
 
         items_to_process = []
+        pending = []  # (index, item, has_existing_summary) needing content
         skipped = 0
 
         for idx, item in enumerate(items, 1):
@@ -320,14 +321,27 @@ Model: {model_used}
                 skipped += 1
                 continue
 
+            pending.append((idx, item, has_existing_summary))
+
+        # Download attachments concurrently and parse them across processes
+        if pending:
+            print(f"\nExtracting content from {len(pending)} sources...\n")
+        contents = self.extract_items_parallel(
+            [item for _, item, _ in pending], char_limit=self.GENERAL_SUMMARY_CHAR_LIMIT
+        )
+
+        for idx, item, has_existing_summary in pending:
+            item_key = item['key']
+            item_title = item['data'].get('title', 'Untitled')
+
             if self.force_rebuild and has_existing_summary:
                 print(f"[{idx}/{len(items)}] 🔄 {item_title} - force rebuild enabled")
             else:
                 print(f"[{idx}/{len(items)}] 📚 {item_title}")
 
-            # Extract metadata and content
+            # Extract metadata; content was extracted above
             metadata = self.extract_metadata(item)
-            content, content_type = self.get_source_content(item)
+            content, content_type = contents[item_key]
 
             if not content:
                 print(f"  ⚠️  Could not extract content, skipping")
@@ -344,7 +358,9 @@ Model: {model_used}
                 'item_key': item_key,
                 'item_title': item_title,
                 'metadata': metadata,
-                'content': content,
+                # Keep only the part sent to the LLM; the full text is dropped here
+                'content': content[:self.GENERAL_SUMMARY_CHAR_LIMIT],
+                'truncated': content_len > self.GENERAL_SUMMARY_CHAR_LIMIT,
                 'content_type': content_type,
                 'index': idx,
                 'has_existing_summary': has_existing_summary
@@ -366,17 +382,14 @@ Model: {model_used}
         batch_requests = []
 
         for item_data in items_to_process:
-            content = item_data['content']
-            truncated = len(content) > self.GENERAL_SUMMARY_CHAR_LIMIT
-
             prompt = zr_prompts.general_summary_prompt(
                 project_overview=self.project_overview,
                 tags_list=tags_list,
                 title=item_data['metadata'].get('title', 'Untitled'),
                 authors=item_data['metadata'].get('authors', 'Unknown'),
                 date=item_data['metadata'].get('date', 'Unknown'),
-                content=content[:self.GENERAL_SUMMARY_CHAR_LIMIT],
-                truncated=truncated,
+                content=item_data['content'],
+                truncated=item_data['truncated'],
                 char_limit=self.GENERAL_SUMMARY_CHAR_LIMIT,
                 key_questions=key_questions
             )
@@ -389,8 +402,15 @@ Model: {model_used}
                 'temperature': 0.3  # Lower temp for consistent structured output
             })
 
-        # Step 3: Process batch with parallel LLM calls
-        print(f"Step 3: Generating summaries in parallel ({self.max_workers} workers)...")
+        # Step 3: Process batch (Message Batches API for larger jobs if enabled)
+        use_message_batches = (
+            self.use_message_batches
+            and len(batch_requests) > self.MESSAGE_BATCH_MIN_REQUESTS
+        )
+        if use_message_batches:
+            print(f"Step 3: Generating summaries via Message Batches API...")
+        else:
+            print(f"Step 3: Generating summaries in parallel ({self.max_workers} workers)...")
         print(f"Progress: ", end='', flush=True)
 
         def progress_callback(completed, total):
@@ -546,7 +566,8 @@ Model: {model_used}
             parser=parse_enhanced_summary_response,
             max_workers=self.max_workers,
             rate_limit_delay=self.rate_limit_delay,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            use_message_batches=use_message_batches
         )
 
         print("\n")
@@ -5,8 +5,11 @@ ZoteroResearcher Cleanup Module
 Handles cleanup of ZResearcher projects and summary notes.
 """
 
+import re
 import sys
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Handle both relative and absolute imports
 try:
@@ -14,10 +17,34 @@ try:
 except ImportError:
     from zr_common import ZoteroResearcherBase
 
+# Optional Gemini support (only needed to delete file search stores)
+try:
+    from google import genai
+    _HAS_GENAI = True
+except ImportError:
+    genai = None
+    _HAS_GENAI = False
+
+
+# Summary note title marker: 【ZResearcher Summary: PROJECT_NAME】
+_SUMMARY_TITLE_RE = re.compile(r'【ZResearcher Summary:\s*([^】]+)】')
+
+# Project subcollection name: 【ZResearcher: PROJECT_NAME】 (matched in full)
+_PROJECT_COLL_RE = re.compile(r'【ZResearcher: (.*)】')
+
 
 class ZoteroResearcherCleaner(ZoteroResearcherBase):
     """Handles cleanup of ZResearcher projects and notes"""
 
+    # Maximum items per delete request (Zotero API limit)
+    DELETE_BATCH_SIZE = 50
+
+    # Concurrent per-project Gemini store deletions in cleanup_all_projects
+    GEMINI_DELETE_WORKERS = 4
+
+    # Buffered verbose lines written to stderr per flush in delete paths
+    LOG_FLUSH_LINES = 64
+
     def __init__(
         self,
         library_id: str,
@@ -56,6 +83,48 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
             offline=offline
         )
 
+        # Full item lists (including child notes/attachments) fetched while
+        # counting, keyed by collection key and reused when deleting
+        self._items_cache: Dict[str, List[Dict]] = {}
+
+        # Collection objects by key (display names, delete_collection payloads)
+        self._collection_cache: Dict[str, Dict] = {}
+
+        # Notes (standalone and child) seen by the summary-note finders, so
+        # repeated scans in one run don't refetch them
+        self._notes_cache: Dict[str, List[Dict]] = {}
+
+        # Gemini client, created on first use and shared across projects
+        self._genai_client = None
+        self._genai_api_key = None
+
+        # Verbose messages from delete paths, written to stderr in chunks
+        self._log_buf: List[str] = []
+        self._log_lock = threading.Lock()
+
+    def _buffer_log(self, message: str) -> None:
+        """
+        Queue a verbose message (no-op unless verbose).
+
+        Args:
+            message: Line to write (without trailing newline)
+        """
+        if not self.verbose:
+            return
+        with self._log_lock:
+            self._log_buf.append(message + '\n')
+            full = len(self._log_buf) >= self.LOG_FLUSH_LINES
+        if full:
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        """Write any buffered verbose messages to stderr."""
+        with self._log_lock:
+            if self._log_buf:
+                sys.stderr.write(''.join(self._log_buf))
+                sys.stderr.flush()
+                self._log_buf.clear()
+
     def is_general_summary_note(self, note_html: str, project_name: str = None) -> bool:
         """
         Check if a note is a General Summary note (optionally for a specific project).
@@ -67,6 +136,12 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         Returns:
             True if note is a general summary (for the specified project if provided)
         """
+        # Most notes are not summaries: reject them from the raw HTML before
+        # parsing. A marker in the body (e.g. a quoted or linked summary title)
+        # is not enough, so matches are confirmed against the title below.
+        if not _SUMMARY_TITLE_RE.search(note_html):
+            return False
+
         # Check title: should match the pattern 【ZResearcher Summary: PROJECT_NAME】
         title = self.get_note_title_from_html(note_html)
 
@@ -78,6 +153,72 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
             # Check if it matches the pattern for any project
             return '【ZResearcher Summary:' in title and '】' in title
 
+    def _iter_collection_notes(self, collection_key: str) -> Iterator[Dict]:
+        """
+        Iterate over every note in a collection, standalone and child notes alike.
+
+        The collection items endpoint includes child items, so filtering it to
+        notes returns summary notes attached to items without one children()
+        request per item. The next page is fetched in the background while the
+        caller scans the current one, and the complete listing is remembered
+        for later scans.
+
+        Args:
+            collection_key: The collection key
+
+        Yields:
+            Note items in the collection
+        """
+        notes = self._notes_cache.get(collection_key)
+        if notes is not None:
+            yield from notes
+            return
+
+        if self.offline:
+            print(f"Error: Cannot scan notes in collection {collection_key} (offline mode)")
+            return
+
+        notes = []
+        for page in self._iter_collection_item_pages(collection_key, top_level=False, itemType='note'):
+            notes.extend(page)
+            yield from page
+
+        self._notes_cache[collection_key] = notes
+
+    def _forget_deleted_items(self, items: List[Dict]) -> None:
+        """
+        Drop deleted items from the listings memoized for this run.
+
+        The remaining listings stay valid, so a later scan in the same run
+        (e.g. project cleanup after an all-projects preview) doesn't refetch
+        whole collections.
+
+        Args:
+            items: Items that were deleted
+        """
+        if not items:
+            return
+        deleted_keys = {item.get('key') for item in items}
+        for memo in (self._notes_cache, self._items_cache):
+            for collection_key, listing in memo.items():
+                memo[collection_key] = [item for item in listing if item.get('key') not in deleted_keys]
+
+    def _get_collection(self, collection_key: str) -> Dict:
+        """
+        Get a collection object, fetching it from the API at most once.
+
+        Args:
+            collection_key: The collection key
+
+        Returns:
+            Collection object as returned by pyzotero
+        """
+        collection = self._collection_cache.get(collection_key)
+        if collection is None:
+            collection = self.zot.collection(collection_key)
+            self._collection_cache[collection_key] = collection
+        return collection
+
     def find_general_summary_notes_for_project(
         self,
         collection_key: str,
@@ -97,37 +238,20 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         Returns:
             List of note items that are general summaries for this project
         """
-        items = self.get_collection_items(collection_key)
         summary_notes = []
+        scanned = 0
 
-        if self.verbose:
-            print(f"  Scanning {len(items)} items for summary notes...")
-
-        for item in items:
-            item_data = item['data']
-            item_type = item_data.get('itemType')
-
-            # Check if this item itself is a standalone note
-            if item_type == 'note':
-                note_html = item_data.get('note', '')
+        try:
+            for note in self._iter_collection_notes(collection_key):
+                scanned += 1
+                note_html = note['data'].get('note', '')
                 if self.is_general_summary_note(note_html, project_name):
-                    summary_notes.append(item)
+                    summary_notes.append(note)
+        except Exception as e:
+            print(f"  ⚠️  Error scanning notes in collection {collection_key}: {e}")
 
-            # Also check child notes attached to this item
-            elif item_type not in ['note', 'attachment']:
-                # Get child items (notes and attachments)
-                item_key = item['key']
-                try:
-                    children = self.zot.children(item_key)
-                    for child in children:
-                        child_data = child['data']
-                        if child_data.get('itemType') == 'note':
-                            note_html = child_data.get('note', '')
-                            if self.is_general_summary_note(note_html, project_name):
-                                summary_notes.append(child)
-                except Exception as e:
-                    if self.verbose:
-                        print(f"  ⚠️  Error checking children for {item_key}: {e}")
+        if self.verbose:
+            print(f"  Scanned {scanned} notes for summary notes...")
 
         return summary_notes
 
@@ -145,37 +269,20 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         Returns:
             List of note items that are general summaries
         """
-        items = self.get_collection_items(collection_key)
         summary_notes = []
+        scanned = 0
 
-        if self.verbose:
-            print(f"  Scanning {len(items)} items for summary notes...")
-
-        for item in items:
-            item_data = item['data']
-            item_type = item_data.get('itemType')
-
-            # Check if this item itself is a standalone note
-            if item_type == 'note':
-                note_html = item_data.get('note', '')
+        try:
+            for note in self._iter_collection_notes(collection_key):
+                scanned += 1
+                note_html = note['data'].get('note', '')
                 if self.is_general_summary_note(note_html):
-                    summary_notes.append(item)
+                    summary_notes.append(note)
+        except Exception as e:
+            print(f"  ⚠️  Error scanning notes in collection {collection_key}: {e}")
 
-            # Also check child notes attached to this item
-            elif item_type not in ['note', 'attachment']:
-                # Get child items (notes and attachments)
-                item_key = item['key']
-                try:
-                    children = self.zot.children(item_key)
-                    for child in children:
-                        child_data = child['data']
-                        if child_data.get('itemType') == 'note':
-                            note_html = child_data.get('note', '')
-                            if self.is_general_summary_note(note_html):
-                                summary_notes.append(child)
-                except Exception as e:
-                    if self.verbose:
-                        print(f"  ⚠️  Error checking children for {item_key}: {e}")
+        if self.verbose:
+            print(f"  Scanned {scanned} notes for summary notes...")
 
         return summary_notes
 
@@ -191,17 +298,21 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         """
         collections = self.zot.collections_sub(parent_collection_key)
 
-        project_subcollections = []
+        # Listing already returns full objects; keep them for later deletes
         for coll in collections:
-            name = coll['data']['name']
-            # Match pattern: 【ZResearcher: *】
-            if name.startswith('【ZResearcher: ') and name.endswith('】'):
-                project_name = name[len('【ZResearcher: '):-1]
-                project_subcollections.append({
-                    'key': coll['key'],
-                    'name': name,
-                    'project_name': project_name
-                })
+            self._collection_cache[coll['key']] = coll
+
+        # Match pattern: 【ZResearcher: *】
+        matches = ((coll, _PROJECT_COLL_RE.fullmatch(coll['data']['name'])) for coll in collections)
+        project_subcollections = [
+            {
+                'key': coll['key'],
+                'name': match.group(0),
+                'project_name': match.group(1)
+            }
+            for coll, match in matches
+            if match
+        ]
 
         return project_subcollections
 
@@ -215,27 +326,77 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         Returns:
             Dict with counts: {'notes': N, 'files': N, 'items': N, 'total': N}
         """
-        try:
-            items = self.zot.everything(self.zot.collection_items(collection_key))
-
-            counts = {'notes': 0, 'files': 0, 'items': 0, 'total': 0}
-
+        # Reuse a full listing if one was already fetched for this collection
+        items = self._items_cache.get(collection_key)
+        if items is not None:
+            notes = files = others = 0
             for item in items:
-                item_type = item['data'].get('itemType', 'unknown')
+                item_type = item['data'].get('itemType')
                 if item_type == 'note':
-                    counts['notes'] += 1
+                    notes += 1
                 elif item_type == 'attachment':
-                    counts['files'] += 1
+                    files += 1
                 else:
-                    counts['items'] += 1
-                counts['total'] += 1
+                    others += 1
+            return {'notes': notes, 'files': files, 'items': others, 'total': notes + files + others}
 
-            return counts
+        try:
+            # Only totals are needed: read Total-Results from single-item pages
+            notes = self._count_collection_items(collection_key, itemType='note')
+            files = self._count_collection_items(collection_key, itemType='attachment')
+            total = self._count_collection_items(collection_key)
+
+            return {
+                'notes': notes,
+                'files': files,
+                'items': max(total - notes - files, 0),
+                'total': total
+            }
         except Exception as e:
             if self.verbose:
                 print(f"  ⚠️  Error counting items: {e}")
             return {'notes': 0, 'files': 0, 'items': 0, 'total': 0}
 
+    def _materialize_subcollection_items(self, subcollections: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Fetch the full item list of each subcollection once, for preview and delete.
+
+        Results are stored in self._items_cache, which count_items_in_collection
+        and the delete paths consult before hitting the API.
+
+        Args:
+            subcollections: Project subcollections (dicts with a 'key')
+
+        Returns:
+            Dict mapping subcollection key to its items (including children)
+        """
+        for subcoll in subcollections:
+            key = subcoll['key']
+            if key in self._items_cache:
+                continue
+            try:
+                self._items_cache[key] = self.zot.everything(self.zot.collection_items(key))
+            except Exception as e:
+                # Leave uncached; preview and delete fall back to their own queries
+                if self.verbose:
+                    print(f"  ⚠️  Error fetching items for {subcoll['name']}: {e}")
+
+        return {sc['key']: self._items_cache[sc['key']] for sc in subcollections if sc['key'] in self._items_cache}
+
+    def _count_collection_items(self, collection_key: str, **params) -> int:
+        """
+        Get the number of items in a collection without downloading them.
+
+        Args:
+            collection_key: The collection key
+            **params: Extra API filters (e.g. itemType='note')
+
+        Returns:
+            Value of the Total-Results header for the query
+        """
+        self.zot.collection_items(collection_key, limit=1, **params)
+        return int(self.zot.request.headers.get('Total-Results', 0))
+
     def preview_cleanup(
         self,
         subcollections: List[Dict],
@@ -253,10 +414,16 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         print()
         print(f"Scanning collection '{collection_name}'...\n")
 
+        # Count each subcollection once; reused for display and totals
+        counts_by_key = {
+            sc['key']: self.count_items_in_collection(sc['key'])
+            for sc in subcollections
+        }
+
         # Show subcollections and their contents
         for subcoll in subcollections:
             print(f"Found project: {subcoll['name']}")
-            counts = self.count_items_in_collection(subcoll['key'])
+            counts = counts_by_key[subcoll['key']]
             print(f"  ├─ {counts['notes']} notes")
             print(f"  ├─ {counts['files']} file attachments")
             print(f"  └─ {counts['items']} other items")
@@ -268,10 +435,7 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
 
         # Calculate totals
         total_subcollections = len(subcollections)
-        total_subcollection_items = sum(
-            self.count_items_in_collection(sc['key'])['total']
-            for sc in subcollections
-        )
+        total_subcollection_items = sum(c['total'] for c in counts_by_key.values())
         total_summary_notes = len(summary_notes)
 
         # Display deletion summary
@@ -299,83 +463,170 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
             print("\nCancelled.")
             return False
 
-    def delete_gemini_files_for_project(self, collection_key: str, gemini_api_key: str = None) -> Dict[str, any]:
+    def _get_genai_client(self, gemini_api_key: str = None):
         """
-        Delete Gemini file search store for this project.
+        Get the shared Gemini client, creating it on first use.
 
         Args:
-            collection_key: Parent collection key
             gemini_api_key: Google Gemini API key (optional, will try to load from env)
 
         Returns:
-            Dict with deletion results: {'deleted': N, 'errors': [...]}
+            google.genai Client, or None if Gemini cleanup isn't possible
         """
-        result = {'deleted': 0, 'errors': []}
-
         # Get Gemini API key
         if not gemini_api_key:
             import os
             gemini_api_key = os.getenv('GEMINI_API_KEY')
 
         if not gemini_api_key:
-            if self.verbose:
-                print("  ℹ️  No GEMINI_API_KEY found, skipping Gemini cleanup")
+            self._buffer_log("  ℹ️  No GEMINI_API_KEY found, skipping Gemini cleanup")
+            return None
+
+        if not _HAS_GENAI:
+            self._buffer_log("  ⚠️  google-genai package not found, skipping Gemini cleanup")
+            return None
+
+        # Reuse one Gemini client (and its connection pool) per API key
+        if self._genai_client is None or self._genai_api_key != gemini_api_key:
+            self._genai_client = genai.Client(api_key=gemini_api_key)
+            self._genai_api_key = gemini_api_key
+        return self._genai_client
+
+    def _delete_gemini_store(self, genai_client, config: Dict) -> Dict[str, any]:
+        """
+        Delete the Gemini file search store named in a project config.
+
+        Makes no Zotero calls, so several projects can be handled at once.
+
+        Args:
+            genai_client: Client from _get_genai_client()
+            config: The project's loaded config
+
+        Returns:
+            Dict with deletion results: {'deleted': N, 'errors': [...]}
+        """
+        result = {'deleted': 0, 'errors': []}
+
+        # Get file search store name
+        store_name = config.get('gemini_file_search_store', '')
+        if not store_name:
+            self._buffer_log("  ℹ️  No Gemini file search store found in project config")
             return result
 
+        # Delete the file search store using config={'force': True} (deletes all documents in it)
+        print(f"  🗑️  Deleting Gemini file search store...")
         try:
-            # Initialize Gemini client
-            try:
-                from google import genai
-                genai_client = genai.Client(api_key=gemini_api_key)
-            except ImportError:
-                if self.verbose:
-                    print("  ⚠️  google-genai package not found, skipping Gemini cleanup")
+            genai_client.file_search_stores.delete(name=store_name, config={'force': True})
+            result['deleted'] = 1
+            self._buffer_log(f"    ✅ Deleted store: {store_name}")
+        except Exception as e:
+            error_msg = f"Failed to delete Gemini file search store {store_name}: {e}"
+            result['errors'].append(error_msg)
+            self._buffer_log(f"    ⚠️  {error_msg}")
+
+        return result
+
+    def delete_gemini_files_for_project(
+        self,
+        collection_key: str,
+        gemini_api_key: str = None,
+        project_name: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Delete Gemini file search store for this project.
+
+        Args:
+            collection_key: Parent collection key
+            gemini_api_key: Google Gemini API key (optional, will try to load from env)
+            project_name: Project whose store to delete (defaults to self.project_name)
+
+        Returns:
+            Dict with deletion results: {'deleted': N, 'errors': [...]}
+        """
+        result = {'deleted': 0, 'errors': []}
+
+        try:
+            genai_client = self._get_genai_client(gemini_api_key)
+            if genai_client is None:
                 return result
 
             # Load project config to get file search store
             try:
-                config = self.load_project_config_from_zotero(collection_key)
+                config = self.load_project_config_from_zotero(collection_key, project_name=project_name)
             except (FileNotFoundError, ValueError):
                 # No config found, nothing to delete
-                if self.verbose:
-                    print("  ℹ️  No project config found, no Gemini store to delete")
-                return result
-
-            # Get file search store name
-            store_name = config.get('gemini_file_search_store', '')
-            if not store_name:
-                if self.verbose:
-                    print("  ℹ️  No Gemini file search store found in project config")
+                self._buffer_log("  ℹ️  No project config found, no Gemini store to delete")
                 return result
 
-            # Delete the file search store using config={'force': True} (deletes all documents in it)
-            print(f"  🗑️  Deleting Gemini file search store...")
-            try:
-                genai_client.file_search_stores.delete(name=store_name, config={'force': True})
-                result['deleted'] = 1
-                if self.verbose:
-                    print(f"    ✅ Deleted store: {store_name}")
-            except Exception as e:
-                error_msg = f"Failed to delete Gemini file search store {store_name}: {e}"
-                result['errors'].append(error_msg)
-                if self.verbose:
-                    print(f"    ⚠️  {error_msg}")
+            return self._delete_gemini_store(genai_client, config)
 
         except Exception as e:
             error_msg = f"Error during Gemini cleanup: {e}"
             result['errors'].append(error_msg)
-            if self.verbose:
-                print(f"  ⚠️  {error_msg}")
+            self._buffer_log(f"  ⚠️  {error_msg}")
 
         return result
 
-    def delete_collection_recursive(self, collection_key: str, parent_collection_key: str = None) -> Dict[str, any]:
+    def _delete_items_batched(self, items: List[Dict], label: str = 'item') -> Tuple[List[Dict], List[str]]:
+        """
+        Delete items with one API request per batch of DELETE_BATCH_SIZE.
+
+        If a batch request fails, that batch is retried one item at a time so
+        failures are still reported per item.
+
+        Args:
+            items: Items to delete (full item dicts, as pyzotero requires)
+            label: Item description for error messages (e.g., 'item', 'note')
+
+        Returns:
+            Tuple of (successfully deleted items, error messages)
+        """
+        deleted_items = []
+        errors = []
+
+        # Multi-item deletes are checked against the library version, not item versions
+        library_version = self.get_library_version()
+
+        for start in range(0, len(items), self.DELETE_BATCH_SIZE):
+            batch = items[start:start + self.DELETE_BATCH_SIZE]
+            try:
+                self.zot.delete_item(batch, last_modified=library_version)
+                deleted_items.extend(batch)
+                # Each write bumps the library version
+                library_version = self.zot.request.headers.get('Last-Modified-Version', library_version)
+                continue
+            except Exception as e:
+                self._buffer_log(f"  ⚠️  Batch delete failed ({e}), retrying items individually")
+
+            for item in batch:
+                try:
+                    self.zot.delete_item(item)
+                    deleted_items.append(item)
+                except Exception as e:
+                    error_msg = f"Failed to delete {label} {item.get('key', 'unknown')}: {e}"
+                    errors.append(error_msg)
+                    self._buffer_log(f"  ⚠️  {error_msg}")
+
+            library_version = self.get_library_version()
+
+        self._forget_deleted_items(deleted_items)
+        self._flush_log()
+
+        return deleted_items, errors
+
+    def delete_collection_recursive(
+        self,
+        collection_key: str,
+        parent_collection_key: str = None,
+        items: Optional[List[Dict]] = None
+    ) -> Dict[str, any]:
         """
         Delete a collection and all its contents recursively.
 
         Args:
             collection_key: The collection key to delete
             parent_collection_key: Optional parent collection key for cache invalidation
+            items: Optional pre-fetched collection items (skips re-fetching them)
 
         Returns:
             Dict with deletion results: {'notes': N, 'files': N, 'items': N, 'errors': [...]}
@@ -386,44 +637,41 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         cache = self._get_cache(parent_collection_key) if parent_collection_key else None
 
         try:
-            # Get all items in collection (including children)
-            items = self.zot.everything(self.zot.collection_items(collection_key))
+            # Get all items in collection (including children), unless already fetched
+            if items is None:
+                items = self.zot.everything(self.zot.collection_items(collection_key))
 
-            # Delete each item
-            for item in items:
-                try:
-                    item_key = item['key']
-                    item_type = item['data'].get('itemType', 'unknown')
+            # Delete items in batches
+            deleted_items, errors = self._delete_items_batched(items, label='item')
+            deleted['errors'].extend(errors)
 
-                    self.zot.delete_item(item)
+            for item in deleted_items:
+                item_key = item['key']
+                item_type = item['data'].get('itemType', 'unknown')
 
-                    # Invalidate cache for deleted item
-                    if cache:
-                        if item_type == 'note' or item_type == 'attachment':
-                            # For child items, invalidate as child
-                            cache.invalidate_child(item_key)
-                        else:
-                            # For regular items, invalidate item and all its children
-                            cache.invalidate_item(item_key)
-
-                    if item_type == 'note':
-                        deleted['notes'] += 1
-                    elif item_type == 'attachment':
-                        deleted['files'] += 1
+                # Invalidate cache for deleted item
+                if cache:
+                    if item_type == 'note' or item_type == 'attachment':
+                        # For child items, invalidate as child
+                        cache.invalidate_child(item_key)
                     else:
-                        deleted['items'] += 1
+                        # For regular items, invalidate item and all its children
+                        cache.invalidate_item(item_key)
 
-                except Exception as e:
-                    error_msg = f"Failed to delete item {item.get('key', 'unknown')}: {e}"
-                    deleted['errors'].append(error_msg)
-                    if self.verbose:
-                        print(f"  ⚠️  {error_msg}")
+                if item_type == 'note':
+                    deleted['notes'] += 1
+                elif item_type == 'attachment':
+                    deleted['files'] += 1
+                else:
+                    deleted['items'] += 1
 
             # Delete the collection itself
             try:
                 # Retrieve collection object (pyzotero requires the full object, not just the key)
-                collection = self.zot.collection(collection_key)
+                collection = self._get_collection(collection_key)
                 self.zot.delete_collection(collection)
+                self._collection_cache.pop(collection_key, None)
+                self.forget_subcollection(collection_key)
 
                 # Invalidate cache for deleted collection
                 if cache:
@@ -432,15 +680,14 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
             except Exception as e:
                 error_msg = f"Failed to delete collection {collection_key}: {e}"
                 deleted['errors'].append(error_msg)
-                if self.verbose:
-                    print(f"  ⚠️  {error_msg}")
+                self._buffer_log(f"  ⚠️  {error_msg}")
 
         except Exception as e:
             error_msg = f"Failed to retrieve collection items: {e}"
             deleted['errors'].append(error_msg)
-            if self.verbose:
-                print(f"  ⚠️  {error_msg}")
+            self._buffer_log(f"  ⚠️  {error_msg}")
 
+        self._flush_log()
         return deleted
 
     def delete_vector_index_for_project(
@@ -463,9 +710,12 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
             return result
 
         try:
-            # Get all items in the collection
-            items = self.get_collection_items(collection_key)
-            item_keys = [item['key'] for item in items if item.get('data', {}).get('itemType') not in ['attachment', 'note']]
+            # Get all items in the collection (keys and types are all that's needed)
+            columns = self.get_collection_item_columns(collection_key)
+            item_keys = [
+                key for key, item_type in zip(columns['keys'], columns['item_types'])
+                if item_type not in ('attachment', 'note')
+            ]
 
             # Delete vectors for each item
             for item_key in item_keys:
@@ -530,11 +780,16 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
 
         # Get collection name for display
         try:
-            collection = self.zot.collection(collection_key)
+            collection = self._get_collection(collection_key)
             collection_name = collection['data']['name']
         except:
             collection_name = collection_key
 
+        # A real run deletes everything it previews, so fetch each
+        # subcollection's items once up front and count from that listing
+        if not dry_run:
+            self._materialize_subcollection_items(subcollections)
+
         # Show preview
         self.preview_cleanup(subcollections, summary_notes, collection_name)
 
@@ -557,6 +812,7 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
             gemini_result = self.delete_gemini_files_for_project(collection_key)
             total_deleted['gemini_files'] += gemini_result['deleted']
             total_deleted['errors'].extend(gemini_result['errors'])
+            self._flush_log()
 
         # Delete vector index
         vector_result = self.delete_vector_index_for_project(collection_key)
@@ -566,7 +822,11 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         # Delete subcollection and contents
         for subcoll in subcollections:
             print(f"\n  Deleting {subcoll['name']}...")
-            result = self.delete_collection_recursive(subcoll['key'], parent_collection_key=collection_key)
+            result = self.delete_collection_recursive(
+                subcoll['key'],
+                parent_collection_key=collection_key,
+                items=self._items_cache.pop(subcoll['key'], None)
+            )
             total_deleted['notes'] += result['notes']
             total_deleted['files'] += result['files']
             total_deleted['items'] += result['items']
@@ -576,21 +836,17 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         if summary_notes:
             print(f"\n  Deleting {len(summary_notes)} general summary notes...")
             cache = self._get_cache(collection_key)
-            for note in summary_notes:
-                try:
-                    note_key = note.get('key')
-                    self.zot.delete_item(note)
+            deleted_notes, errors = self._delete_items_batched(summary_notes, label='note')
+            total_deleted['errors'].extend(errors)
 
-                    # Invalidate cache for deleted note
-                    if cache and note_key:
-                        cache.invalidate_child(note_key)
+            for note in deleted_notes:
+                note_key = note.get('key')
 
-                    total_deleted['notes'] += 1
-                except Exception as e:
-                    error_msg = f"Failed to delete note {note.get('key', 'unknown')}: {e}"
-                    total_deleted['errors'].append(error_msg)
-                    if self.verbose:
-                        print(f"  ⚠️  {error_msg}")
+                # Invalidate cache for deleted note
+                if cache and note_key:
+                    cache.invalidate_child(note_key)
+
+                total_deleted['notes'] += 1
 
         # Report results
         print("\n" + "=" * 60)
@@ -629,11 +885,13 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         print("\n🧹 Cleanup ALL Projects in Collection")
         print("=" * 60)
 
-        # Find all project subcollections
-        subcollections = self.find_all_project_subcollections(collection_key)
-
-        # Find all general summary notes
-        summary_notes = self.find_all_general_summary_notes(collection_key)
+        # Find all general summary notes in the background while this thread
+        # lists project subcollections. Only this thread uses self.zot: the
+        # note scan pages through its own clients (see _iter_collection_item_pages)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            summary_notes_future = executor.submit(self.find_all_general_summary_notes, collection_key)
+            subcollections = self.find_all_project_subcollections(collection_key)
+            summary_notes = summary_notes_future.result()
 
         # Check if anything to delete
         if not subcollections and not summary_notes:
@@ -642,11 +900,16 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
 
         # Get collection name for display
         try:
-            collection = self.zot.collection(collection_key)
+            collection = self._get_collection(collection_key)
             collection_name = collection['data']['name']
         except:
             collection_name = collection_key
 
+        # A real run deletes everything it previews, so fetch each
+        # subcollection's items once up front and count from that listing
+        if not dry_run:
+            self._materialize_subcollection_items(subcollections)
+
         # Show preview
         self.preview_cleanup(subcollections, summary_notes, collection_name)
 
@@ -665,14 +928,41 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         print("\n🗑️  Deleting items...")
         total_deleted = {'notes': 0, 'files': 0, 'items': 0, 'gemini_files': 0, 'vector_chunks': 0, 'errors': []}
 
-        # Delete Gemini files for each project
-        for subcoll in subcollections:
-            # Set project name for this iteration
-            self.project_name = subcoll['project_name']
-            print(f"\n  Checking Gemini files for {subcoll['name']}...")
-            gemini_result = self.delete_gemini_files_for_project(collection_key)
-            total_deleted['gemini_files'] += gemini_result['deleted']
-            total_deleted['errors'].extend(gemini_result['errors'])
+        # Delete Gemini files for each project. Configs are read from Zotero on
+        # this thread (the pyzotero client and config memo aren't thread-safe);
+        # only the Gemini store deletes run concurrently.
+        if subcollections:
+            print(f"\n  Checking Gemini files for {len(subcollections)} projects...")
+            try:
+                genai_client = self._get_genai_client()
+            except Exception as e:
+                genai_client = None
+                total_deleted['errors'].append(f"Error during Gemini cleanup: {e}")
+
+            if genai_client is not None:
+                configs = []
+                for subcoll in subcollections:
+                    try:
+                        configs.append(self.load_project_config_from_zotero(
+                            collection_key, project_name=subcoll['project_name']
+                        ))
+                    except (FileNotFoundError, ValueError):
+                        self._buffer_log(
+                            f"  ℹ️  No project config found for {subcoll['project_name']}, "
+                            f"no Gemini store to delete"
+                        )
+                    except Exception as e:
+                        total_deleted['errors'].append(f"Error during Gemini cleanup: {e}")
+
+                with ThreadPoolExecutor(max_workers=self.GEMINI_DELETE_WORKERS) as executor:
+                    gemini_results = executor.map(
+                        lambda config: self._delete_gemini_store(genai_client, config),
+                        configs
+                    )
+                    for gemini_result in gemini_results:
+                        total_deleted['gemini_files'] += gemini_result['deleted']
+                        total_deleted['errors'].extend(gemini_result['errors'])
+            self._flush_log()
 
         # Delete all vector indexes
         print(f"\n  Deleting vector indexes...")
@@ -683,7 +973,11 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         # Delete all subcollections
         for subcoll in subcollections:
             print(f"\n  Deleting {subcoll['name']}...")
-            result = self.delete_collection_recursive(subcoll['key'], parent_collection_key=collection_key)
+            result = self.delete_collection_recursive(
+                subcoll['key'],
+                parent_collection_key=collection_key,
+                items=self._items_cache.pop(subcoll['key'], None)
+            )
             total_deleted['notes'] += result['notes']
             total_deleted['files'] += result['files']
             total_deleted['items'] += result['items']
@@ -693,21 +987,17 @@ class ZoteroResearcherCleaner(ZoteroResearcherBase):
         if summary_notes:
             print(f"\n  Deleting {len(summary_notes)} general summary notes...")
             cache = self._get_cache(collection_key)
-            for note in summary_notes:
-                try:
-                    note_key = note.get('key')
-                    self.zot.delete_item(note)
+            deleted_notes, errors = self._delete_items_batched(summary_notes, label='note')
+            total_deleted['errors'].extend(errors)
 
-                    # Invalidate cache for deleted note
-                    if cache and note_key:
-                        cache.invalidate_child(note_key)
+            for note in deleted_notes:
+                note_key = note.get('key')
 
-                    total_deleted['notes'] += 1
-                except Exception as e:
-                    error_msg = f"Failed to delete note {note.get('key', 'unknown')}: {e}"
-                    total_deleted['errors'].append(error_msg)
-                    if self.verbose:
-                        print(f"  ⚠️  {error_msg}")
+                # Invalidate cache for deleted note
+                if cache and note_key:
+                    cache.invalidate_child(note_key)
+
+                total_deleted['notes'] += 1
 
         # Report results
         print("\n" + "=" * 60)
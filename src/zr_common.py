@@ -5,21 +5,401 @@ ZoteroResearcher Common Module
 Shared base class and utilities for all ZoteroResearcher workflows.
 """
 
+import html
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import time
 import requests
-import trafilatura
-import fitz  # PyMuPDF
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from copy import deepcopy
+from functools import cached_property, lru_cache
+from itertools import repeat
 from docx import Document
-from io import BytesIO
-from typing import Optional, Dict, List, Tuple, Any
-from anthropic import Anthropic
+from io import BytesIO, StringIO
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, Any, Union, Set
+
+# PyMuPDF, Trafilatura and the Anthropic SDK are imported where first used:
+# metadata-only commands (init, export, cleanup, --help) never load them
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from .zr_llm_client import ZRLLMClient
+
+# Optional Resiliparse support (much faster main-content HTML extraction)
+try:
+    from resiliparse.extract.html2text import extract_plain_text
+    from resiliparse.parse.html import HTMLTree
+    _HAS_RESILIPARSE = True
+except ImportError:
+    extract_plain_text = None
+    HTMLTree = None
+    _HAS_RESILIPARSE = False
+
+# charset-normalizer ships with requests; used to guess non-UTF-8 text encodings
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
 
 # Handle both relative and absolute imports
 try:
     from .zotero_base import ZoteroBaseProcessor
-    from .zr_llm_client import ZRLLMClient
 except ImportError:
     from zotero_base import ZoteroBaseProcessor
-    from zr_llm_client import ZRLLMClient
+
+
+@lru_cache(maxsize=None)
+def _pdf_text_flags() -> int:
+    """
+    PyMuPDF text flags for page extraction.
+
+    Expands ligatures (no TEXT_PRESERVE_LIGATURES) and joins hyphenated line
+    breaks, which reads better for the LLM than the defaults; images are
+    never collected (no TEXT_PRESERVE_IMAGES). Page loops resolve this once
+    and pass it to _pdf_page_text.
+    """
+    import fitz  # PyMuPDF
+    return fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_DEHYPHENATE
+
+
+def _pdf_page_text(page, flags: int, skip_scanned: bool = True, sort: bool = False) -> str:
+    """
+    Extract one PDF page's text, skipping pages that cannot contain any.
+
+    Args:
+        page: PyMuPDF page
+        flags: Text extraction flags (see _pdf_text_flags)
+        skip_scanned: If True, return "" without parsing the content stream for
+            pages that reference no fonts (image-only/scanned pages)
+        sort: If True, sort text blocks into reading order (slower; helps
+            multi-column layouts whose content stream is out of order)
+
+    Returns:
+        Page text ("" for skipped pages)
+    """
+    # Text needs a font; the font list comes from page resources, not content
+    if skip_scanned and not page.get_fonts():
+        return ""
+    return page.get_text("text", flags=flags, sort=sort)
+
+
+def _extract_pdf_page_range(
+    pdf_path: str,
+    start: int,
+    stop: int,
+    skip_scanned: bool = True,
+    sort: bool = False
+) -> List[str]:
+    """
+    Extract the text of pages [start, stop) from a PDF (process-pool worker).
+
+    PyMuPDF documents can't be pickled or shared across threads, so each
+    worker process opens its own copy of the file.
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: First page index
+        stop: Page index to stop before
+        skip_scanned: Skip pages without fonts (see _pdf_page_text)
+        sort: Sort text blocks into reading order (see _pdf_page_text)
+
+    Returns:
+        List of page texts, in page order
+    """
+    import fitz  # PyMuPDF
+
+    flags = _pdf_text_flags()
+    with fitz.open(pdf_path, filetype="pdf") as pdf_document:
+        return [
+            _pdf_page_text(pdf_document.load_page(i), flags, skip_scanned, sort)
+            for i in range(start, stop)
+        ]
+
+
+def _extract_html_resiliparse(html_document: Union[str, bytes]) -> Optional[str]:
+    """Main-content plain text via Resiliparse (None when not installed)."""
+    if not _HAS_RESILIPARSE:
+        return None
+    if isinstance(html_document, bytes):
+        # Lexbor parses the raw bytes; no Python-side decode first
+        tree = HTMLTree.parse_from_bytes(html_document, 'utf-8')
+    else:
+        tree = HTMLTree.parse(html_document)
+    return extract_plain_text(tree, main_content=True, preserve_formatting=True)
+
+
+def _extract_html_trafilatura_fast(document: Any) -> Optional[str]:
+    """Trafilatura markdown (tables and links kept) without its fallback extractors."""
+    import trafilatura
+
+    return trafilatura.extract(
+        document,
+        output_format='markdown',
+        fast=True,
+        include_links=True,
+        include_images=False,
+        include_tables=True
+    )
+
+
+def _extract_html_trafilatura_precise(document: Any) -> Optional[str]:
+    """Full Trafilatura markdown extraction (with fallback extractors)."""
+    import trafilatura
+
+    return trafilatura.extract(
+        document,
+        output_format='markdown',
+        include_links=True,
+        include_images=False,
+        include_tables=True
+    )
+
+
+# HTML extractors available to html_extractors chains, by config name
+_HTML_EXTRACTORS = {
+    'resiliparse': _extract_html_resiliparse,
+    'trafilatura_fast': _extract_html_trafilatura_fast,
+    'trafilatura_precise': _extract_html_trafilatura_precise,
+}
+
+# Extractors that accept a parsed lxml tree (the HTML is parsed once and each
+# of these gets a copy, since Trafilatura prunes the tree it's given)
+_TREE_HTML_EXTRACTORS = {'trafilatura_fast', 'trafilatura_precise'}
+
+# Extractor output shorter than this moves on to the next extractor in the
+# chain (main-content detection can be too aggressive on some pages)
+_HTML_MIN_CHARS = 200
+
+
+# DOCX heading styles ("Heading 1" ... "Heading 6") and their markdown prefixes
+_DOCX_HEADING_RE = re.compile(r'heading\s*([1-6])', re.IGNORECASE)
+_DOCX_HEADING_PREFIXES = ['', '# ', '## ', '### ', '#### ', '##### ', '###### ']
+
+
+def _docx_heading_prefix(style_name: str) -> str:
+    """
+    Get the markdown heading prefix for a DOCX paragraph style.
+
+    Args:
+        style_name: Paragraph style name (e.g. "Heading 2")
+
+    Returns:
+        Prefix such as "## " for heading styles, "" otherwise
+    """
+    match = _DOCX_HEADING_RE.search(style_name)
+    return _DOCX_HEADING_PREFIXES[int(match.group(1))] if match else ''
+
+
+# One key=value config line (comment lines never match: keys can't start with #)
+_CONFIG_LINE_RE = re.compile(r'^[^\S\n]*([A-Za-z_][A-Za-z0-9_]*)[^\S\n]*=[^\S\n]*(.*?)\s*$', re.M)
+
+
+# First characters of int/float config values (anything else stays a string,
+# so e.g. "nan", "inf" or the JSON in gemini_uploaded_files is never parsed)
+_CONFIG_NUMBER_START = frozenset('+-.0123456789')
+
+
+def _coerce_config_value(value: str) -> Any:
+    """
+    Convert a config value string to bool, int, float or (otherwise) str.
+
+    Negative and scientific numbers work; other text stays a string.
+
+    Args:
+        value: Raw value text
+
+    Returns:
+        Converted value
+    """
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    if value and value[0] in _CONFIG_NUMBER_START:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _parse_config_text(content: str) -> Dict[str, Any]:
+    """
+    Parse project config note text into a dict of key=value settings.
+
+    Args:
+        content: Plain text of the config note
+
+    Returns:
+        Dict of typed configuration values
+    """
+    return {
+        match.group(1): _coerce_config_value(match.group(2))
+        for match in _CONFIG_LINE_RE.finditer(content)
+    }
+
+
+# Project config keys applied by apply_project_config:
+# key -> (attribute, kind, *rule arguments); see _validate_config_value
+_CONFIG_SPEC = {
+    'max_workers': ('max_workers', 'int', 1, 50),
+    'rate_limit_delay': ('rate_limit_delay', 'float', 0.0, 10.0),
+    'general_summary_char_limit': ('general_summary_char_limit', 'int', 1000, 1000000),
+    'targeted_summary_char_limit': ('targeted_summary_char_limit', 'int', 1000, 1000000),
+    'relevance_threshold': ('relevance_threshold', 'int', 0, 10),
+    'max_sources': ('max_sources', 'int', 1, 1000),
+    'relevance_batch_size': ('relevance_batch_size', 'int', 1, 50),
+    'use_haiku': ('use_haiku', 'bool'),
+    'haiku_model': ('haiku_model', 'str_prefix', 'claude-'),
+    'sonnet_model': ('sonnet_model', 'str_prefix', 'claude-'),
+    'gemini_file_search_model': ('gemini_file_search_model', 'str_prefix', 'gemini-'),
+    'skip_scanned_pages': ('skip_scanned_pages', 'bool'),
+    'html_extractors': ('html_extractor_chain', 'extractor_chain'),
+    'use_message_batches': ('use_message_batches', 'bool'),
+    'generate_synthesis': ('synthesis_enabled', 'bool'),
+}
+
+
+# Template placeholders that mark a project note as not yet edited
+# (add alternatives here to recognise more sentinels in the same single scan)
+_TEMPLATE_PLACEHOLDER_RE = re.compile(r'\[TODO:')
+
+
+# Characters not allowed in project names (title brackets and control whitespace)
+_INVALID_PROJECT_CHARS_RE = re.compile(r'[【】\n\r\t]')
+
+
+def _dedup_extend(items: List[Dict], seen_keys: set, new_items) -> None:
+    """
+    Append items whose key is not yet in seen_keys, recording their keys.
+
+    Args:
+        items: List to extend in place
+        seen_keys: Keys already in items (updated in place)
+        new_items: Iterable of Zotero items to merge
+    """
+    for item in new_items:
+        # Interned keys let repeat lookups match by identity before comparing text
+        key = sys.intern(item['key'])
+        if key not in seen_keys:
+            seen_keys.add(key)
+            items.append(item)
+
+
+@lru_cache(maxsize=8)
+def _format_available_subcollections(names: Tuple[str, ...]) -> str:
+    """
+    Format subcollection names for "not found" errors (memoized per name set).
+
+    Args:
+        names: Subcollection names, sorted (so equal maps share an entry)
+
+    Returns:
+        Comma-separated, quoted names
+    """
+    return ', '.join(f'"{n}"' for n in names)
+
+
+# Default project configuration note content (written by --init-collection)
+_DEFAULT_CONFIG_TEMPLATE = """# ZResearcher Project Configuration
+# Edit values below to customize this project's behavior
+# Lines starting with # are comments and will be ignored
+
+# ============================================================
+# Performance Settings
+# ============================================================
+max_workers=20
+rate_limit_delay=0.1
+
+# ============================================================
+# Content Truncation Limits (characters)
+# ============================================================
+general_summary_char_limit=500000
+targeted_summary_char_limit=500000
+
+# Skip PDF pages with no fonts (scanned images yield no extractable text)
+skip_scanned_pages=true
+
+# HTML extractors tried in order until one finds enough text
+# (resiliparse, trafilatura_fast, trafilatura_precise)
+html_extractors=resiliparse,trafilatura_fast,trafilatura_precise
+
+# ============================================================
+# Relevance & Filtering
+# ============================================================
+relevance_threshold=6
+max_sources=50
+# Sources scored together in one relevance request (1 = one request per source)
+relevance_batch_size=10
+
+# ============================================================
+# LLM Model Configuration
+# ============================================================
+# Model for Phase 1 summaries (build-summaries)
+# Default: Sonnet (better for nuanced project-aware analysis)
+# Set use_haiku=true to reduce cost (~12x cheaper, less nuanced)
+use_haiku=false
+haiku_model=claude-haiku-4-5
+sonnet_model=claude-sonnet-4-5
+# Note: use_sonnet is deprecated but still supported for backward compatibility
+
+# Submit Phase 1 summaries through the Anthropic Message Batches API
+# (50% cheaper, but results can take minutes or longer to arrive)
+use_message_batches=false
+
+# ============================================================
+# Research Synthesis
+# ============================================================
+generate_synthesis=true
+
+# ============================================================
+# Gemini File Search Configuration
+# ============================================================
+gemini_file_search_model=gemini-2.5-pro
+
+# ============================================================
+# Gemini File API State (managed automatically)
+# DO NOT EDIT - these are updated by --file-search
+# ============================================================
+gemini_uploaded_files={}
+
+# ============================================================
+# Vector Database Configuration
+# ============================================================
+vector_chunk_size=512
+vector_chunk_overlap=50
+vector_top_k=20
+vector_embedding_model=all-MiniLM-L6-v2
+
+# ============================================================
+# Notes:
+# - Boolean values: true/false (case insensitive)
+# - Integer values: whole numbers
+# - Float values: decimal numbers (use . not ,)
+# - Changes take effect on next build/query operation
+# - Restart not required - just re-run the command
+# ============================================================
+"""
+
+
+def project_subcollection_name(project_name: str) -> str:
+    """
+    Get the subcollection name used to store a project's data.
+
+    Args:
+        project_name: Project name
+
+    Returns:
+        Subcollection name (e.g. "【ZResearcher: NAME】")
+    """
+    return f"【ZResearcher: {project_name}】"
 
 
 def validate_project_name(name: str) -> str:
@@ -48,10 +428,9 @@ def validate_project_name(name: str) -> str:
 
     # Check for problematic characters
     # Zotero handles most characters fine, but let's be cautious with special chars
-    problematic_chars = ['【', '】', '\n', '\r', '\t']
-    for char in problematic_chars:
-        if char in name:
-            raise ValueError(f"Project name contains invalid character: '{char}'")
+    match = _INVALID_PROJECT_CHARS_RE.search(name)
+    if match:
+        raise ValueError(f"Project name contains invalid character: {match.group()!r}")
 
     return name
 
@@ -63,6 +442,42 @@ class ZoteroResearcherBase(ZoteroBaseProcessor):
     GENERAL_SUMMARY_CHAR_LIMIT = 500000   # Phase 1: General summaries
     TARGETED_SUMMARY_CHAR_LIMIT = 500000  # Phase 2: Targeted summaries
 
+    # Maximum bytes read from a web page fetch (larger responses are cut off;
+    # extracted text is truncated far below this anyway)
+    MAX_URL_FETCH_BYTES = 32 * 1024 * 1024
+
+    # Note titles in the project subcollection (same for every project)
+    PROJECT_OVERVIEW_NOTE_TITLE = "【Project Overview】"
+    RESEARCH_TAGS_NOTE_TITLE = "【Research Tags】"
+    RESEARCH_BRIEF_NOTE_TITLE = "【Research Brief】"
+    QUERY_REQUEST_NOTE_TITLE = "【Query Request】"
+    PROJECT_CONFIG_NOTE_TITLE = "【Project Config】"
+
+    # Default HTML extractor chain (see _extract_html_main_text)
+    HTML_EXTRACTOR_CHAIN = ('resiliparse', 'trafilatura_fast', 'trafilatura_precise')
+
+    # Full-document PDF extractions at least this long are split across processes
+    PDF_PARALLEL_MIN_PAGES = 32
+
+    # Fewest pages handed to each PDF extraction process (each one reopens the
+    # document, so tiny page ranges cost more in startup than they save)
+    PDF_MIN_PAGES_PER_WORKER = 16
+
+    # Downloaded attachments queued per extract_items_parallel process (with
+    # the downloads in progress, bounds how many files are held in memory)
+    EXTRACTION_QUEUE_PER_WORKER = 2
+
+    # PDFs longer than twice the sample where every one of PDF_SCAN_SAMPLE_PAGES
+    # pages spread across the document has fewer characters than this are
+    # likely scans: they are read sequentially (image-only pages are skipped
+    # by the font check) instead of starting a process pool
+    PDF_SCAN_SAMPLE_PAGES = 5
+    PDF_SCANNED_CHARS_PER_PAGE = 50
+
+    # Minimum pending requests before use_message_batches routes through the
+    # Message Batches API (smaller jobs stay on synchronous parallel calls)
+    MESSAGE_BATCH_MIN_REQUESTS = 5
+
     def __init__(
         self,
         library_id: str,
@@ -101,11 +516,15 @@ class ZoteroResearcherBase(ZoteroBaseProcessor):
         self.project_name = validate_project_name(project_name) if project_name else None
 
         # Researcher-specific configuration
-        self.anthropic_client = Anthropic(api_key=anthropic_api_key)
+        # (Anthropic clients are created lazily on first use; see anthropic_client)
+        self._anthropic_api_key = anthropic_api_key
 
         # Operational flags
         self.force_rebuild = force_rebuild
 
+        # Memoized Zotero lookups for this run (see _memo)
+        self._mem: Dict[Any, Any] = {}
+
         # Content loaded from Zotero (populated during operations)
         self.research_brief = ""
         self.project_overview = ""
@@ -118,9 +537,14 @@ class ZoteroResearcherBase(ZoteroBaseProcessor):
         self.general_summary_char_limit = self.GENERAL_SUMMARY_CHAR_LIMIT
         self.targeted_summary_char_limit = self.TARGETED_SUMMARY_CHAR_LIMIT
         self.relevance_threshold = 6
+        self.relevance_batch_size = 10  # Sources scored per relevance request
         self.max_sources = 50
         self.use_haiku = False  # Default to Sonnet (better for nuanced analysis)
         self.synthesis_enabled = True  # Default: enabled
+        self.use_message_batches = False  # Default: synchronous parallel calls
+        self.skip_scanned_pages = True  # Don't parse image-only PDF pages
+        self.preserve_reading_order = False  # Set True to sort PDF text blocks into reading order
+        self.html_extractor_chain = list(self.HTML_EXTRACTOR_CHAIN)
 
         # LLM model configuration
         self.haiku_model = "claude-haiku-4-5-20251001"
@@ -130,123 +554,109 @@ class ZoteroResearcherBase(ZoteroBaseProcessor):
         # Use Haiku with use_haiku=true in config for cost savings
         self.summary_model = self.sonnet_model
 
-        # Initialize centralized LLM client for all API calls
-        self.llm_client = ZRLLMClient(
+    @property
+    def project_name(self) -> Optional[str]:
+        """Current project name (None for collection-wide operations)."""
+        return self._project_name
+
+    @project_name.setter
+    def project_name(self, value: Optional[str]):
+        # Precompute the project-derived names once per project, not per call
+        self._project_name = value
+        self._subcollection_name = project_subcollection_name(value) if value else None
+        self._summary_note_prefix = f"【ZResearcher Summary: {value}】" if value else None
+
+    @cached_property
+    def anthropic_client(self) -> 'Anthropic':
+        """Anthropic client, created on first use (cache-only paths never need it)."""
+        from anthropic import Anthropic
+
+        return Anthropic(api_key=self._anthropic_api_key)
+
+    @cached_property
+    def http_session(self) -> requests.Session:
+        """Pooled HTTP session for web page fetches (reuses connections per host)."""
+        session = requests.Session()
+        # Rate-limit and transient server errors are retried on the same pooled
+        # connection (honouring Retry-After); the final response still reaches
+        # raise_for_status in _fetch_url_text
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @cached_property
+    def llm_client(self) -> 'ZRLLMClient':
+        """Centralized LLM client for all API calls, created on first use."""
+        from anthropic import AsyncAnthropic
+        try:
+            from .zr_llm_client import ZRLLMClient
+        except ImportError:
+            from zr_llm_client import ZRLLMClient
+
+        anthropic_api_key = self._anthropic_api_key
+        return ZRLLMClient(
             anthropic_client=self.anthropic_client,
             default_model=self.haiku_model,
-            verbose=verbose
+            verbose=self.verbose,
+            async_client_factory=lambda: AsyncAnthropic(api_key=anthropic_api_key, max_retries=3)
         )
 
     def _get_subcollection_name(self) -> str:
         """Get project-specific subcollection name."""
-        if not self.project_name:
+        if not self._subcollection_name:
             raise ValueError("Project name is required but not set")
-        return f"【ZResearcher: {self.project_name}】"
+        return self._subcollection_name
 
     def _get_project_overview_note_title(self) -> str:
         """Get project-specific overview note title."""
         if not self.project_name:
             raise ValueError("Project name is required but not set")
-        return f"【Project Overview】"
+        return self.PROJECT_OVERVIEW_NOTE_TITLE
 
     def _get_research_tags_note_title(self) -> str:
         """Get project-specific tags note title."""
         if not self.project_name:
             raise ValueError("Project name is required but not set")
-        return f"【Research Tags】"
+        return self.RESEARCH_TAGS_NOTE_TITLE
 
     def _get_research_brief_note_title(self) -> str:
         """Get project-specific brief note title."""
         if not self.project_name:
             raise ValueError("Project name is required but not set")
-        return f"【Research Brief】"
+        return self.RESEARCH_BRIEF_NOTE_TITLE
 
     def _get_query_request_note_title(self) -> str:
         """Get project-specific query request note title (for File Search)."""
         if not self.project_name:
             raise ValueError("Project name is required but not set")
-        return f"【Query Request】"
+        return self.QUERY_REQUEST_NOTE_TITLE
 
     def _get_project_config_note_title(self) -> str:
         """Get project-specific config note title."""
         if not self.project_name:
             raise ValueError("Project name is required but not set")
-        return f"【Project Config】"
+        return self.PROJECT_CONFIG_NOTE_TITLE
 
     def _get_summary_note_prefix(self) -> str:
         """Get project-specific summary note prefix (used as note title/heading)."""
-        if not self.project_name:
+        if not self._summary_note_prefix:
             raise ValueError("Project name is required but not set")
-        return f"【ZResearcher Summary: {self.project_name}】"
+        return self._summary_note_prefix
 
-    def _get_default_config_template(self) -> str:
+    @staticmethod
+    def _get_default_config_template() -> str:
         """Get the default project configuration template."""
-        return """# ZResearcher Project Configuration
-# Edit values below to customize this project's behavior
-# Lines starting with # are comments and will be ignored
-
-# ============================================================
-# Performance Settings
-# ============================================================
-max_workers=20
-rate_limit_delay=0.1
-
-# ============================================================
-# Content Truncation Limits (characters)
-# ============================================================
-general_summary_char_limit=500000
-targeted_summary_char_limit=500000
-
-# ============================================================
-# Relevance & Filtering
-# ============================================================
-relevance_threshold=6
-max_sources=50
-
-# ============================================================
-# LLM Model Configuration
-# ============================================================
-# Model for Phase 1 summaries (build-summaries)
-# Default: Sonnet (better for nuanced project-aware analysis)
-# Set use_haiku=true to reduce cost (~12x cheaper, less nuanced)
-use_haiku=false
-haiku_model=claude-haiku-4-5
-sonnet_model=claude-sonnet-4-5
-# Note: use_sonnet is deprecated but still supported for backward compatibility
-
-# ============================================================
-# Research Synthesis
-# ============================================================
-generate_synthesis=true
-
-# ============================================================
-# Gemini File Search Configuration
-# ============================================================
-gemini_file_search_model=gemini-2.5-pro
-
-# ============================================================
-# Gemini File API State (managed automatically)
-# DO NOT EDIT - these are updated by --file-search
-# ============================================================
-gemini_uploaded_files={}
-
-# ============================================================
-# Vector Database Configuration
-# ============================================================
-vector_chunk_size=512
-vector_chunk_overlap=50
-vector_top_k=20
-vector_embedding_model=all-MiniLM-L6-v2
-
-# ============================================================
-# Notes:
-# - Boolean values: true/false (case insensitive)
-# - Integer values: whole numbers
-# - Float values: decimal numbers (use . not ,)
-# - Changes take effect on next build/query operation
-# - Restart not required - just re-run the command
-# ============================================================
-"""
+        return _DEFAULT_CONFIG_TEMPLATE
 
     def extract_metadata(self, item: Dict) -> Dict:
         """
@@ -260,36 +670,115 @@ vector_embedding_model=all-MiniLM-L6-v2
         """
         item_data = item['data']
 
-        # Extract basic fields
-        metadata = {
+        # Extract authors/creators
+        authors = []
+        for creator in item_data.get('creators', []):
+            if 'lastName' in creator:
+                if 'firstName' in creator:
+                    authors.append(f"{creator['firstName']} {creator['lastName']}")
+                else:
+                    authors.append(creator['lastName'])
+            elif 'name' in creator:
+                authors.append(creator['name'])
+
+        return {
             'title': item_data.get('title', 'Untitled'),
             'date': item_data.get('date', 'Unknown date'),
             'publication': item_data.get('publicationTitle', item_data.get('bookTitle', '')),
             'url': item_data.get('url', ''),
-            'itemType': item_data.get('itemType', 'unknown')
+            'itemType': item_data.get('itemType', 'unknown'),
+            'authors': ', '.join(authors) if authors else 'Unknown author'
         }
 
-        # Extract authors/creators
-        creators = item_data.get('creators', [])
-        if creators:
-            authors = []
-            for creator in creators:
-                if 'lastName' in creator:
-                    if 'firstName' in creator:
-                        authors.append(f"{creator['firstName']} {creator['lastName']}")
-                    else:
-                        authors.append(creator['lastName'])
-                elif 'name' in creator:
-                    authors.append(creator['name'])
-            metadata['authors'] = ', '.join(authors) if authors else 'Unknown author'
-        else:
-            metadata['authors'] = 'Unknown author'
+    def _fetch_url_text(self, url: str) -> str:
+        """
+        Fetch a web page, streaming at most MAX_URL_FETCH_BYTES of the body.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Decoded response body (possibly cut off at the byte cap)
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status
+        """
+        with self.http_session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                body += chunk
+                if len(body) >= self.MAX_URL_FETCH_BYTES:
+                    del body[self.MAX_URL_FETCH_BYTES:]
+                    break
+
+            return body.decode(response.encoding or 'utf-8', errors='replace')
+
+    def _extract_url_main_text(self, url: str) -> Optional[str]:
+        """
+        Fetch a web page and extract its main text, once per URL per run.
+
+        A snapshot whose extraction comes up empty falls back to its source
+        URL, and webpage items then try the item URL, usually the same page;
+        the memo turns the repeat into a lookup. Failed fetches raise and are
+        not remembered.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Extracted text, or None if nothing could be extracted
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status
+        """
+        return self._memo(
+            ('url_text', url),
+            lambda: self._extract_html_main_text(self._fetch_url_text(url))
+        )
+
+    def _extract_html_main_text(self, html_document: Union[str, bytes]) -> Optional[str]:
+        """
+        Extract the main content of an HTML page with the configured extractor chain.
+
+        Extractors run in html_extractor_chain order, cheapest first; the first
+        result of at least _HTML_MIN_CHARS characters wins, otherwise the
+        longest result seen is returned.
+
+        Args:
+            html_document: HTML document, as text or raw bytes (bytes are
+                decoded by the extractors themselves)
+
+        Returns:
+            Extracted text (stripped), or None if nothing could be extracted
+        """
+        best = None
+        tree = None
+        for name in self.html_extractor_chain:
+            started = time.perf_counter()
+            if name in _TREE_HTML_EXTRACTORS:
+                if tree is None:
+                    import trafilatura
+
+                    tree = trafilatura.load_html(html_document)
+                text = _HTML_EXTRACTORS[name](deepcopy(tree)) if tree is not None else None
+            else:
+                text = _HTML_EXTRACTORS[name](html_document)
+            text = text.strip() if text else ""
+            if self.verbose:
+                print(f"  ⏱️  {name}: {len(text):,} chars in {time.perf_counter() - started:.2f}s")
 
-        return metadata
+            if len(text) >= _HTML_MIN_CHARS:
+                return text
+            if text and (best is None or len(text) > len(best)):
+                best = text
+
+        return best
 
     def extract_text_from_html(self, html_content: bytes, attachment_url: Optional[str] = None) -> Optional[str]:
         """
-        Extract text from HTML content using Trafilatura.
+        Extract text from HTML content using the configured extractor chain.
         Reused from summarize_sources.py.
 
         Args:
@@ -300,35 +789,22 @@ vector_embedding_model=all-MiniLM-L6-v2
             Extracted text, or None if extraction fails
         """
         try:
-            # Try to decode bytes to string
-            html_string = html_content.decode('utf-8', errors='ignore')
-
-            # Use Trafilatura for extraction
-            markdown = trafilatura.extract(
-                html_string,
-                output_format='markdown',
-                include_links=True,
-                include_images=False,
-                include_tables=True
-            )
-
-            if markdown:
-                return markdown.strip()
+            if b'<' not in html_content[:512]:
+                # No markup at the start: plain text saved as a snapshot, so
+                # there is no DOM worth parsing
+                text = html_content.decode('utf-8', errors='ignore').strip()
+            else:
+                # Extractors take the raw bytes (no up-front decode of the snapshot)
+                text = self._extract_html_main_text(html_content)
+            if text:
+                return text
 
-            # If Trafilatura fails and we have a URL, try fetching directly
-            if attachment_url and not markdown:
+            # If extraction fails and we have a URL, try fetching directly
+            if attachment_url:
                 print("  ⚠️  Trying to fetch from URL...")
-                response = requests.get(attachment_url, timeout=30)
-                response.raise_for_status()
-                markdown = trafilatura.extract(
-                    response.text,
-                    output_format='markdown',
-                    include_links=True,
-                    include_images=False,
-                    include_tables=True
-                )
-                if markdown:
-                    return markdown.strip()
+                text = self._extract_url_main_text(attachment_url)
+                if text:
+                    return text
 
             return None
 
@@ -336,38 +812,161 @@ vector_embedding_model=all-MiniLM-L6-v2
             print(f"  ❌ Error extracting HTML: {e}")
             return None
 
-    def extract_text_from_pdf(self, pdf_content: bytes) -> Optional[str]:
+    def _extract_pdf_pages_parallel(self, pdf_bytes: bytes, page_count: int) -> Optional[List[str]]:
         """
-        Extract text from a PDF using PyMuPDF.
-        Reused from summarize_sources.py.
+        Extract every page's text using a process pool (one contiguous page range per worker).
 
         Args:
-            pdf_content: The PDF file content as bytes
+            pdf_bytes: The PDF file content as bytes
+            page_count: Number of pages in the document
 
         Returns:
-            Extracted text as string, or None if extraction failed
+            List of page texts in page order, or None if parallel extraction
+            isn't worthwhile or failed (callers fall back to sequential)
         """
+        workers = min(
+            self.max_workers,
+            os.cpu_count() or 1,
+            page_count // self.PDF_MIN_PAGES_PER_WORKER
+        )
+        if workers < 2:
+            return None
+
+        bounds = [page_count * n // workers for n in range(workers + 1)]
         try:
-            # Open PDF from bytes
-            pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
+            # Workers open the PDF from a temp file rather than each being sent the bytes
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                pdf_path = os.path.join(tmp_dir, "source.pdf")
+                with open(pdf_path, 'wb') as f:
+                    f.write(pdf_bytes)
+
+                # Other threads (page prefetch, downloads) may be running: don't fork
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_extraction_mp_context()) as executor:
+                    chunks = list(executor.map(
+                        _extract_pdf_page_range, repeat(pdf_path), bounds[:-1], bounds[1:],
+                        repeat(self.skip_scanned_pages), repeat(self.preserve_reading_order)
+                    ))
+        except Exception as e:
+            if self.verbose:
+                print(f"  ⚠️  Parallel PDF extraction failed ({e}), extracting sequentially")
+            return None
 
-            extracted_text = []
-            total_pages = len(pdf_document)
+        return [text for chunk in chunks for text in chunk]
 
-            # Extract text from each page
-            for page_num in range(total_pages):
-                page = pdf_document[page_num]
-                text = page.get_text()
-                if text.strip():
-                    extracted_text.append(text)
+    def _extract_pdf_text(
+        self,
+        pdf_bytes: bytes,
+        char_limit: Optional[int] = None,
+        parallel: bool = True
+    ) -> Tuple[Optional[str], int]:
+        """
+        Extract plain text from PDF bytes with PyMuPDF, page by page.
 
-            pdf_document.close()
+        Whole-document extractions of long PDFs are spread over worker
+        processes; budgeted extractions read pages in order so they can stop early.
+        Long PDFs that look scanned (see PDF_SCAN_SAMPLE_PAGES) are read in
+        this process, since their pages are mostly skipped without parsing.
 
-            full_text = "\n\n".join(extracted_text) if extracted_text else None
+        Args:
+            pdf_bytes: The PDF file content as bytes
+            char_limit: Stop reading pages once this many characters have been
+                collected (None reads the whole document)
+            parallel: Whether long PDFs may be spread over worker processes
+
+        Returns:
+            Tuple of (text joined by blank lines or None if no text, pages read)
+        """
+        # Pages are written straight into one buffer, blank-line separated
+        buf = StringIO()
+        separator = ""
+        total_chars = 0
+        pages_read = 0
+
+        import fitz  # PyMuPDF
+
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_document:
+            page_count = pdf_document.page_count
+            flags = _pdf_text_flags()
+
+            def page_text(index: int) -> str:
+                return _pdf_page_text(
+                    pdf_document.load_page(index), flags,
+                    self.skip_scanned_pages, self.preserve_reading_order
+                )
+
+            # Sample pages spread across long PDFs. If every sampled page is
+            # (nearly) empty the document is probably a scan: worker processes
+            # would mostly skip image-only pages, so read it here instead. Every
+            # page is still read, in case some of them do have text.
+            sampled = {}
+            likely_scanned = False
+            if self.skip_scanned_pages and page_count > 2 * self.PDF_SCAN_SAMPLE_PAGES:
+                step = page_count / self.PDF_SCAN_SAMPLE_PAGES
+                for n in range(self.PDF_SCAN_SAMPLE_PAGES):
+                    index = int(step * n + step / 2)
+                    sampled[index] = page_text(index)
+                likely_scanned = all(
+                    len(text.strip()) < self.PDF_SCANNED_CHARS_PER_PAGE for text in sampled.values()
+                )
+                if likely_scanned and self.verbose:
+                    print(f"  ⚠️  PDF looks scanned ({len(sampled)} sampled pages have almost no text), "
+                          f"reading it without worker processes")
+
+            page_texts = None
+            if (parallel and char_limit is None and not likely_scanned
+                    and page_count >= self.PDF_PARALLEL_MIN_PAGES):
+                page_texts = self._extract_pdf_pages_parallel(pdf_bytes, page_count)
+
+            if page_texts is not None:
+                pages_read = len(page_texts)
+                for text in page_texts:
+                    if text and not text.isspace():
+                        buf.write(separator)
+                        buf.write(text)
+                        separator = "\n\n"
+            else:
+                texts = (sampled[i] if i in sampled else page_text(i) for i in range(page_count))
+                for text in texts:
+                    pages_read += 1
+                    # isspace() stops at the first non-blank character; strip() copies the page
+                    if text and not text.isspace():
+                        buf.write(separator)
+                        buf.write(text)
+                        separator = "\n\n"
+                        total_chars += len(text)
+
+                    # Later pages would be truncated away before reaching the LLM
+                    if char_limit is not None and total_chars > char_limit:
+                        break
+
+        return buf.getvalue() or None, pages_read
+
+    def extract_text_from_pdf(
+        self,
+        pdf_content: bytes,
+        char_limit: Optional[int] = None,
+        parallel: bool = True
+    ) -> Optional[str]:
+        """
+        Extract text from a PDF using PyMuPDF.
+        Reused from summarize_sources.py.
+
+        Args:
+            pdf_content: The PDF file content as bytes
+            char_limit: Optional character budget; pages after it is exceeded
+                are not parsed (the result is still longer than char_limit, so
+                callers can detect truncation)
+            parallel: Whether long PDFs may be spread over worker processes
+
+        Returns:
+            Extracted text as string, or None if extraction failed
+        """
+        try:
+            full_text, pages_read = self._extract_pdf_text(pdf_content, char_limit, parallel)
 
             # Check if PDF is likely scanned (very little text)
-            if full_text and total_pages > 0:
-                avg_chars_per_page = len(full_text) / total_pages
+            if full_text and pages_read > 0:
+                avg_chars_per_page = len(full_text) / pages_read
                 if avg_chars_per_page < 100:
                     print(f"  ⚠️  Warning: PDF appears to be scanned (low text density)")
 
@@ -388,22 +987,23 @@ vector_embedding_model=all-MiniLM-L6-v2
             Extracted text as string, or None if extraction failed
         """
         try:
-            # Try UTF-8 first, then fall back to other encodings
-            try:
-                text = txt_content.decode('utf-8')
-            except UnicodeDecodeError:
-                # Try common alternative encodings
-                for encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
-                    try:
-                        text = txt_content.decode(encoding)
-                        print(f"  ℹ️  Decoded using {encoding} encoding")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    # If all else fails, decode with errors='replace'
-                    text = txt_content.decode('utf-8', errors='replace')
-                    print(f"  ⚠️  Warning: Some characters could not be decoded")
+            if txt_content.startswith((b'\xff\xfe', b'\xfe\xff')):
+                # UTF-16 byte order mark (the codec consumes it)
+                text = txt_content.decode('utf-16', errors='replace')
+            else:
+                try:
+                    # utf-8-sig also accepts (and drops) a UTF-8 byte order mark
+                    text = txt_content.decode('utf-8-sig')
+                except UnicodeDecodeError:
+                    # Not UTF-8: detect the encoding in one pass instead of trying several
+                    match = charset_normalizer.from_bytes(txt_content).best() if charset_normalizer else None
+                    if match is not None:
+                        text = str(match)
+                        if self.verbose:
+                            print(f"  ℹ️  Decoded using {match.encoding} encoding")
+                    else:
+                        text = txt_content.decode('cp1252', errors='replace')
+                        print(f"  ⚠️  Warning: Could not detect encoding, decoded as cp1252")
 
             return text.strip() if text else None
 
@@ -426,7 +1026,11 @@ vector_embedding_model=all-MiniLM-L6-v2
             # Open DOCX from bytes using BytesIO
             doc = Document(BytesIO(docx_content))
 
-            extracted_parts = []
+            # Output is written straight into one buffer, one part per line
+            buf = StringIO()
+
+            # Markdown heading prefix per style name (documents reuse a handful of styles)
+            heading_prefixes: Dict[str, str] = {}
 
             # Extract text from paragraphs with style preservation
             for paragraph in doc.paragraphs:
@@ -435,48 +1039,45 @@ vector_embedding_model=all-MiniLM-L6-v2
                     continue
 
                 # Detect heading styles and convert to markdown
-                style_name = paragraph.style.name.lower()
-                if 'heading 1' in style_name:
-                    extracted_parts.append(f"\n# {text}\n")
-                elif 'heading 2' in style_name:
-                    extracted_parts.append(f"\n## {text}\n")
-                elif 'heading 3' in style_name:
-                    extracted_parts.append(f"\n### {text}\n")
-                elif 'heading 4' in style_name:
-                    extracted_parts.append(f"\n#### {text}\n")
-                elif 'heading 5' in style_name:
-                    extracted_parts.append(f"\n##### {text}\n")
-                elif 'heading 6' in style_name:
-                    extracted_parts.append(f"\n###### {text}\n")
+                style_name = paragraph.style.name
+                prefix = heading_prefixes.get(style_name)
+                if prefix is None:
+                    prefix = heading_prefixes[style_name] = _docx_heading_prefix(style_name)
+
+                if prefix:
+                    buf.write(f"\n{prefix}{text}\n\n")
                 else:
-                    extracted_parts.append(text)
+                    buf.write(text)
+                    buf.write("\n")
 
             # Extract text from tables
-            if doc.tables:
-                for table in doc.tables:
-                    extracted_parts.append("\n")  # Add spacing before table
-                    for i, row in enumerate(table.rows):
-                        row_text = []
-                        for cell in row.cells:
-                            cell_text = ' '.join(p.text.strip() for p in cell.paragraphs if p.text.strip())
-                            row_text.append(cell_text)
-
-                        # Create markdown-style table
-                        extracted_parts.append("| " + " | ".join(row_text) + " |")
-
-                        # Add separator after header row
-                        if i == 0:
-                            extracted_parts.append("| " + " | ".join(["---"] * len(row_text)) + " |")
-
-                    extracted_parts.append("\n")  # Add spacing after table
-
-            full_text = "\n".join(extracted_parts) if extracted_parts else None
+            for table in doc.tables:
+                row_lines = []
+                for row in table.rows:
+                    # p.text walks the paragraph XML, so read it once per paragraph
+                    row_text = [
+                        ' '.join(t for t in (p.text.strip() for p in cell.paragraphs) if t)
+                        for cell in row.cells
+                    ]
+
+                    # Create markdown-style table, with a separator after the header row
+                    row_lines.append("| " + " | ".join(row_text) + " |")
+                    if len(row_lines) == 1:
+                        row_lines.append("| " + " | ".join(["---"] * len(row_text)) + " |")
+
+                # Spacing before and after each table
+                buf.write("\n\n")
+                buf.write("\n".join(row_lines))
+                buf.write("\n\n\n")
+
+            # Strip once (the old join-then-strip-twice copied the text three times)
+            full_text = buf.getvalue().strip()
 
             # Check if document has meaningful content
-            if full_text and len(full_text.strip()) < 50:
+            if buf.tell() and len(full_text) < 50:
                 print(f"  ⚠️  Warning: DOCX appears to have very little text content")
 
-            return full_text.strip() if full_text else None
+            return full_text or None
 
         except Exception as e:
             # Check for specific error types
@@ -491,10 +1092,45 @@ vector_embedding_model=all-MiniLM-L6-v2
                 print(f"  ❌ Error extracting DOCX text: {e}")
             return None
 
-    def get_source_content(self, item: Dict) -> Tuple[Optional[str], Optional[str]]:
+    def _extract_attachment_text(
+        self,
+        content_type: str,
+        content: bytes,
+        attachment_url: Optional[str] = None,
+        char_limit: Optional[int] = None,
+        parallel_pdf: bool = True
+    ) -> Optional[str]:
+        """
+        Extract text from downloaded attachment bytes with the matching extractor.
+
+        Args:
+            content_type: "HTML", "PDF", "DOCX" or "TXT" (see classify_attachment)
+            content: Attachment file content as bytes
+            attachment_url: Attachment URL (HTML fallback fetch)
+            char_limit: Optional character budget for PDF extraction
+            parallel_pdf: Whether long PDFs may be spread over worker processes
+
+        Returns:
+            Extracted text, or None if extraction failed
+        """
+        if content_type == "HTML":
+            return self.extract_text_from_html(content, attachment_url)
+        if content_type == "PDF":
+            return self.extract_text_from_pdf(content, char_limit, parallel_pdf)
+        if content_type == "DOCX":
+            return self.extract_text_from_docx(content)
+        return self.extract_text_from_txt(content)
+
+    def get_source_content(
+        self,
+        item: Dict,
+        char_limit: Optional[int] = None,
+        skip: Optional[Set[str]] = None,
+        parallel_pdf: bool = True
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
         Get content from a source using priority order:
-        1. HTML snapshot (Trafilatura)
+        1. HTML snapshot (Resiliparse/Trafilatura, see html_extractor_chain)
         2. PDF attachment (PyMuPDF)
         3. DOCX attachment (python-docx)
         4. TXT attachment (plain text)
@@ -502,6 +1138,11 @@ vector_embedding_model=all-MiniLM-L6-v2
 
         Args:
             item: The Zotero item
+            char_limit: Optional character budget for PDF extraction (pages past
+                it are skipped when the caller truncates to this limit anyway)
+            skip: Optional attachment keys already tried by the caller (those
+                attachments aren't downloaded or parsed again)
+            parallel_pdf: Whether long PDFs may be spread over worker processes
 
         Returns:
             Tuple of (content_text, content_type) or (None, None) if extraction fails
@@ -514,94 +1155,185 @@ vector_embedding_model=all-MiniLM-L6-v2
         attachments = self.get_item_attachments(item_key)
 
         if attachments:
-            # Priority 1: Try HTML attachment
+            # Bucket attachments by type in one pass, then try them in priority order
+            buckets = {content_type: [] for content_type in self.ATTACHMENT_PRIORITY}
             for attachment in attachments:
-                if self.is_html_attachment(attachment):
-                    attachment_title = attachment['data'].get('title', 'Untitled')
-                    attachment_key = attachment['key']
-                    attachment_url = attachment['data'].get('url')
+                content_type = self.classify_attachment(attachment)
+                if content_type:
+                    buckets[content_type].append(attachment)
+
+            candidates = [
+                (content_type, attachment)
+                for content_type in self.ATTACHMENT_PRIORITY
+                for attachment in buckets[content_type]
+            ]
+
+            for content_type, attachment in candidates:
+                if skip and attachment['key'] in skip:
+                    continue
+                attachment_title = attachment['data'].get('title', 'Untitled')
 
-                    print(f"  📄 Found HTML attachment: {attachment_title}")
-                    print(f"  📥 Downloading and extracting...")
+                print(f"  📄 Found {content_type} attachment: {attachment_title}")
+                print(f"  📥 Downloading..." if content_type == "TXT" else f"  📥 Downloading and extracting...")
 
-                    html_content = self.download_attachment(attachment_key)
-                    if html_content:
-                        extracted = self.extract_text_from_html(html_content, attachment_url)
-                        if extracted:
-                            return extracted, "HTML"
+                content = self.download_attachment(attachment['key'])
+                if content:
+                    extracted = self._extract_attachment_text(
+                        content_type, content, attachment['data'].get('url'), char_limit, parallel_pdf
+                    )
+                    if extracted:
+                        return extracted, content_type
 
-            # Priority 2: Try PDF attachment
-            for attachment in attachments:
-                if self.is_pdf_attachment(attachment):
-                    attachment_title = attachment['data'].get('title', 'Untitled')
-                    attachment_key = attachment['key']
+        # Priority 5: Try fetching from URL (for webpage items)
+        item_url = item_data.get('url')
+        if item_url and item_data.get('itemType') == 'webpage':
+            print(f"  🌐 Fetching from URL: {item_url}")
+            try:
+                text = self._extract_url_main_text(item_url)
+                if text:
+                    return text, "URL"
+            except Exception as e:
+                print(f"  ❌ Error fetching URL: {e}")
 
-                    print(f"  📄 Found PDF attachment: {attachment_title}")
-                    print(f"  📥 Downloading and extracting...")
+        return None, None
 
-                    pdf_content = self.download_attachment(attachment_key)
-                    if pdf_content:
-                        extracted = self.extract_text_from_pdf(pdf_content)
-                        if extracted:
-                            return extracted, "PDF"
+    def _first_attachment(self, item: Dict) -> Optional[Tuple[str, Dict]]:
+        """
+        Find an item's highest-priority extractable attachment (HTML > PDF > DOCX > TXT).
 
-            # Priority 3: Try DOCX attachment
-            for attachment in attachments:
-                if self.is_docx_attachment(attachment):
-                    attachment_title = attachment['data'].get('title', 'Untitled')
-                    attachment_key = attachment['key']
+        Args:
+            item: The Zotero item
 
-                    print(f"  📄 Found DOCX attachment: {attachment_title}")
-                    print(f"  📥 Downloading and extracting...")
+        Returns:
+            Tuple of (content_type, attachment), or None if it has none
+        """
+        best = None
+        for attachment in self.get_item_attachments(item['key']):
+            content_type = self.classify_attachment(attachment)
+            if content_type and (
+                best is None
+                or self.ATTACHMENT_PRIORITY.index(content_type) < self.ATTACHMENT_PRIORITY.index(best[0])
+            ):
+                best = (content_type, attachment)
+        return best
+
+    def extract_items_parallel(
+        self,
+        items: List[Dict],
+        char_limit: Optional[int] = None
+    ) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Get content for many items at once, parsing attachments in worker processes.
 
-                    docx_content = self.download_attachment(attachment_key)
-                    if docx_content:
-                        extracted = self.extract_text_from_docx(docx_content)
-                        if extracted:
-                            return extracted, "DOCX"
+        Each item's highest-priority attachment is downloaded on a worker
+        thread (each with its own Zotero client), then the raw bytes are
+        parsed in a process pool so PDF/DOCX/HTML parsing uses every core.
+        Downloads only run ahead of parsing by EXTRACTION_QUEUE_PER_WORKER
+        attachments per process, so memory stays bounded. Items without
+        attachments, or whose first attachment yields no text, fall back to
+        get_source_content and the rest of its priority order (skipping the
+        attachment already tried).
 
-            # Priority 4: Try TXT attachment
-            for attachment in attachments:
-                if self.is_txt_attachment(attachment):
-                    attachment_title = attachment['data'].get('title', 'Untitled')
-                    attachment_key = attachment['key']
+        Args:
+            items: Zotero items to extract
+            char_limit: Optional character budget for PDF extraction (see get_source_content)
 
-                    print(f"  📄 Found TXT attachment: {attachment_title}")
-                    print(f"  📥 Downloading...")
+        Returns:
+            Dict mapping item key to (content_text, content_type), with
+            (None, None) for items whose content could not be extracted
+        """
+        if not items:
+            return {}
+
+        results = {}
+        workers = min(self.max_workers, os.cpu_count() or 1)
+        max_in_flight = self.ATTACHMENT_DOWNLOAD_WORKERS + workers * self.EXTRACTION_QUEUE_PER_WORKER
+        pending_items = iter(items)
+        downloads = {}    # download future -> (item, content_type, attachment)
+        extractions = {}  # extraction future -> (item, content_type, attachment)
+
+        # Fallbacks run while the pools below are busy, so their PDFs are read
+        # in this process rather than in a nested pool of their own
+        def fall_back(item: Dict, tried: Optional[Dict] = None):
+            skip = {tried['key']} if tried else None
+            results[item['key']] = self.get_source_content(
+                item, char_limit, skip=skip, parallel_pdf=False
+            )
 
-                    txt_content = self.download_attachment(attachment_key)
-                    if txt_content:
-                        extracted = self.extract_text_from_txt(txt_content)
+        # The extraction pool doesn't fork: download threads are already
+        # running when its workers start (see _extraction_mp_context)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_extraction_mp_context(),
+            initializer=_init_extraction_worker,
+            initargs=(
+                self.verbose, self.skip_scanned_pages,
+                self.preserve_reading_order, self.html_extractor_chain
+            )
+        ) as extractor, ThreadPoolExecutor(max_workers=self.ATTACHMENT_DOWNLOAD_WORKERS) as downloader:
+
+            def fill_window():
+                # Attachment lookups stay on this thread; only downloads are handed off
+                while len(downloads) + len(extractions) < max_in_flight:
+                    item = next(pending_items, None)
+                    if item is None:
+                        return
+                    candidate = self._first_attachment(item)
+                    if not candidate:
+                        fall_back(item)
+                        continue
+                    content_type, attachment = candidate
+                    future = downloader.submit(self.download_attachment, attachment['key'])
+                    downloads[future] = (item, content_type, attachment)
+
+            fill_window()
+            while downloads or extractions:
+                done, _ = wait(list(downloads) + list(extractions), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in downloads:
+                        # Hand each attachment to the process pool as soon as it arrives
+                        item, content_type, attachment = downloads.pop(future)
+                        try:
+                            content = future.result()
+                        except Exception as e:
+                            if self.verbose:
+                                print(f"  ⚠️  Could not download attachment for {item['key']}: {e}")
+                            content = None
+                        if not content:
+                            fall_back(item, attachment)
+                            continue
+
+                        extraction = extractor.submit(
+                            _extract_attachment_worker, content_type, content,
+                            attachment['data'].get('url'), char_limit
+                        )
+                        extractions[extraction] = (item, content_type, attachment)
+                    else:
+                        item, content_type, attachment = extractions.pop(future)
+                        try:
+                            extracted = future.result()
+                        except Exception as e:
+                            print(f"  ❌ Error extracting {content_type} for {item['key']}: {e}")
+                            extracted = None
                         if extracted:
-                            return extracted, "TXT"
-
-        # Priority 5: Try fetching from URL (for webpage items)
-        item_url = item_data.get('url')
-        if item_url and item_data.get('itemType') == 'webpage':
-            print(f"  🌐 Fetching from URL: {item_url}")
-            try:
-                response = requests.get(item_url, timeout=30)
-                response.raise_for_status()
-                markdown = trafilatura.extract(
-                    response.text,
-                    output_format='markdown',
-                    include_links=True,
-                    include_images=False,
-                    include_tables=True
-                )
-                if markdown:
-                    return markdown.strip(), "URL"
-            except Exception as e:
-                print(f"  ❌ Error fetching URL: {e}")
+                            results[item['key']] = (extracted, content_type)
+                        else:
+                            fall_back(item, attachment)
+                fill_window()
 
-        return None, None
+        return results
 
-    def load_project_config_from_zotero(self, collection_key: str) -> Dict[str, Any]:
+    def load_project_config_from_zotero(
+        self,
+        collection_key: str,
+        project_name: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Load and parse project configuration from Zotero note.
 
         Args:
             collection_key: Parent collection key
+            project_name: Project to load (defaults to self.project_name)
 
         Returns:
             Dict with parsed configuration values (empty dict if not found)
@@ -609,59 +1341,89 @@ vector_embedding_model=all-MiniLM-L6-v2
         Raises:
             FileNotFoundError: If subcollection or config note not found
         """
-        subcollection_name = self._get_subcollection_name()
-        note_title = self._get_project_config_note_title()
+        if project_name is None:
+            subcollection_name = self._get_subcollection_name()
+            note_title = self._get_project_config_note_title()
+            project_name = self.project_name
+        else:
+            # Explicit project (may differ from self.project_name, e.g. in cleanup)
+            subcollection_name = project_subcollection_name(project_name)
+            note_title = self.PROJECT_CONFIG_NOTE_TITLE
 
-        # Get project-specific subcollection
-        subcollection_key = self.get_subcollection(collection_key, subcollection_name)
+        # Find config note in the project-specific subcollection
+        subcollection_key, note = self._find_project_note(
+            collection_key, subcollection_name, note_title
+        )
         if not subcollection_key:
             raise FileNotFoundError(
                 f"{subcollection_name} subcollection not found. "
-                f"Run --init-collection --project \"{self.project_name}\" first."
+                f"Run --init-collection --project \"{project_name}\" first."
             )
 
-        # Get all notes in subcollection
-        notes = self.get_collection_notes(subcollection_key)
+        if note:
+            # Parse once per note version (several steps reload the config)
+            config = self._memo(
+                ('project_config', note['key'], note.get('version')),
+                lambda: _parse_config_text(self.extract_text_from_note_html(note['data']['note']))
+            )
+            return dict(config)
 
-        for note in notes:
-            title = self.get_note_title_from_html(note['data']['note'])
-            if note_title in title:
-                content = self.extract_text_from_note_html(note['data']['note'])
+        raise FileNotFoundError(
+            f"{note_title} not found in {subcollection_name} subcollection. "
+            f"Run --init-collection --project \"{project_name}\" first."
+        )
 
-                # Parse key=value pairs
-                config = {}
-                for line in content.split('\n'):
-                    line = line.strip()
+    def _validate_config_value(self, key: str, value: Any, kind: str, *args) -> Tuple[bool, Any]:
+        """
+        Validate one config value against its _CONFIG_SPEC rule.
 
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
+        Args:
+            key: Config key (for warnings)
+            value: Parsed config value
+            kind: 'int', 'float', 'bool', 'str_prefix' or 'extractor_chain'
+            *args: Rule arguments ((min, max) for numbers, (prefix,) for str_prefix)
 
-                    # Parse key=value
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-
-                        # Type conversion
-                        if value.lower() in ['true', 'false']:
-                            config[key] = value.lower() == 'true'
-                        elif value.isdigit():
-                            config[key] = int(value)
-                        elif '.' in value:
-                            try:
-                                config[key] = float(value)
-                            except ValueError:
-                                config[key] = value  # Keep as string
-                        else:
-                            config[key] = value
+        Returns:
+            Tuple of (is_valid, value to assign)
+        """
+        if kind in ('int', 'float'):
+            number_types = int if kind == 'int' else (int, float)
+            if isinstance(value, bool) or not isinstance(value, number_types):
+                if self.verbose:
+                    expected = "integer" if kind == 'int' else "number"
+                    print(f"  ⚠️  Invalid {key}: must be {expected}, got {type(value).__name__}")
+                return False, None
+            min_val, max_val = args
+            if not (min_val <= value <= max_val):
+                if self.verbose:
+                    print(f"  ⚠️  Invalid {key}: {value} (must be {min_val}-{max_val})")
+                return False, None
+            return True, value
 
-                return config
+        if kind == 'bool':
+            if isinstance(value, bool):
+                return True, value
+            if self.verbose:
+                print(f"  ⚠️  Invalid {key}: must be true/false, got {value}")
+            return False, None
+
+        if kind == 'str_prefix':
+            prefix, = args
+            if isinstance(value, str) and value.startswith(prefix):
+                # Model names are compared and passed around for every request
+                return True, sys.intern(value)
+            if self.verbose:
+                print(f"  ⚠️  Invalid {key}: must start with '{prefix}'")
+            return False, None
 
-        raise FileNotFoundError(
-            f"{note_title} not found in {subcollection_name} subcollection. "
-            f"Run --init-collection --project \"{self.project_name}\" first."
-        )
+        # extractor_chain: comma-separated _HTML_EXTRACTORS names
+        names = [name.strip() for name in value.split(',')] if isinstance(value, str) else []
+        if names and all(name in _HTML_EXTRACTORS for name in names):
+            return True, names
+        if self.verbose:
+            print(f"  ⚠️  Invalid {key}: must be a comma-separated list of "
+                  f"{', '.join(_HTML_EXTRACTORS)}")
+        return False, None
 
     def apply_project_config(self, config: Dict[str, Any]):
         """
@@ -670,95 +1432,120 @@ vector_embedding_model=all-MiniLM-L6-v2
         Args:
             config: Dict of configuration key-value pairs
         """
-        # Validation rules
-        def validate_int_range(value, min_val, max_val, name):
-            if not isinstance(value, int):
-                if self.verbose:
-                    print(f"  ⚠️  Invalid {name}: must be integer, got {type(value).__name__}")
-                return False
-            if not (min_val <= value <= max_val):
-                if self.verbose:
-                    print(f"  ⚠️  Invalid {name}: {value} (must be {min_val}-{max_val})")
-                return False
-            return True
-
-        def validate_float_range(value, min_val, max_val, name):
-            if not isinstance(value, (int, float)):
-                if self.verbose:
-                    print(f"  ⚠️  Invalid {name}: must be number, got {type(value).__name__}")
-                return False
-            if not (min_val <= value <= max_val):
-                if self.verbose:
-                    print(f"  ⚠️  Invalid {name}: {value} (must be {min_val}-{max_val})")
-                return False
-            return True
-
-        # Apply each configuration value
-        if 'max_workers' in config:
-            if validate_int_range(config['max_workers'], 1, 50, 'max_workers'):
-                self.max_workers = config['max_workers']
-
-        if 'rate_limit_delay' in config:
-            if validate_float_range(config['rate_limit_delay'], 0.0, 10.0, 'rate_limit_delay'):
-                self.rate_limit_delay = config['rate_limit_delay']
-
-        if 'general_summary_char_limit' in config:
-            if validate_int_range(config['general_summary_char_limit'], 1000, 1000000, 'general_summary_char_limit'):
-                self.general_summary_char_limit = config['general_summary_char_limit']
-
-        if 'targeted_summary_char_limit' in config:
-            if validate_int_range(config['targeted_summary_char_limit'], 1000, 1000000, 'targeted_summary_char_limit'):
-                self.targeted_summary_char_limit = config['targeted_summary_char_limit']
-
-        if 'relevance_threshold' in config:
-            if validate_int_range(config['relevance_threshold'], 0, 10, 'relevance_threshold'):
-                self.relevance_threshold = config['relevance_threshold']
-
-        if 'max_sources' in config:
-            if validate_int_range(config['max_sources'], 1, 1000, 'max_sources'):
-                self.max_sources = config['max_sources']
-
-        # Handle use_haiku (new, preferred) and use_sonnet (deprecated, backward compat)
-        if 'use_haiku' in config:
-            if isinstance(config['use_haiku'], bool):
-                self.use_haiku = config['use_haiku']
-                # Update summary model based on use_haiku
-                self.summary_model = self.haiku_model if self.use_haiku else self.sonnet_model
-            elif self.verbose:
-                print(f"  ⚠️  Invalid use_haiku: must be true/false, got {config['use_haiku']}")
-        elif 'use_sonnet' in config:
-            # Backward compatibility: use_sonnet inverts to use_haiku
-            if isinstance(config['use_sonnet'], bool):
-                self.use_haiku = not config['use_sonnet']
-                self.summary_model = self.haiku_model if self.use_haiku else self.sonnet_model
+        # Apply each recognised configuration value (see _CONFIG_SPEC)
+        for key, value in config.items():
+            spec = _CONFIG_SPEC.get(key)
+            if spec is None:
+                continue
+            attribute, kind, *args = spec
+            valid, value = self._validate_config_value(key, value, kind, *args)
+            if valid:
+                setattr(self, attribute, value)
+
+        # Backward compatibility: use_sonnet (deprecated) inverts to use_haiku
+        if 'use_sonnet' in config and 'use_haiku' not in config:
+            valid, use_sonnet = self._validate_config_value('use_sonnet', config['use_sonnet'], 'bool')
+            if valid:
+                self.use_haiku = not use_sonnet
                 if self.verbose:
                     print(f"  ⚠️  use_sonnet is deprecated, use use_haiku instead")
-            elif self.verbose:
-                print(f"  ⚠️  Invalid use_sonnet: must be true/false, got {config['use_sonnet']}")
-
-        if 'haiku_model' in config:
-            if isinstance(config['haiku_model'], str) and config['haiku_model'].startswith('claude-'):
-                self.haiku_model = config['haiku_model']
-            elif self.verbose:
-                print(f"  ⚠️  Invalid haiku_model: must start with 'claude-'")
-
-        if 'sonnet_model' in config:
-            if isinstance(config['sonnet_model'], str) and config['sonnet_model'].startswith('claude-'):
-                self.sonnet_model = config['sonnet_model']
-            elif self.verbose:
-                print(f"  ⚠️  Invalid sonnet_model: must start with 'claude-'")
-
-        if 'gemini_file_search_model' in config:
-            if isinstance(config['gemini_file_search_model'], str) and config['gemini_file_search_model'].startswith('gemini-'):
-                self.gemini_file_search_model = config['gemini_file_search_model']
-            elif self.verbose:
-                print(f"  ⚠️  Invalid gemini_file_search_model: must start with 'gemini-'")
-
-        if 'generate_synthesis' in config:
-            if isinstance(config['generate_synthesis'], bool):
-                self.synthesis_enabled = config['generate_synthesis']
-            elif self.verbose:
-                print(f"  ⚠️  Invalid generate_synthesis: must be true/false, got {config['generate_synthesis']}")
+
+        # Summary model follows use_haiku and the (possibly overridden) model names
+        if config.keys() & {'use_haiku', 'use_sonnet', 'haiku_model', 'sonnet_model'}:
+            self.summary_model = self.haiku_model if self.use_haiku else self.sonnet_model
+
+    def _memo(self, key: Any, loader):
+        """
+        Return the memoized value for key, calling loader() only on first use.
+
+        Args:
+            key: Hashable memo key
+            loader: Zero-argument callable producing the value
+
+        Returns:
+            The memoized (or freshly loaded) value
+        """
+        if key not in self._mem:
+            self._mem[key] = loader()
+        return self._mem[key]
+
+    def _find_project_note(
+        self,
+        collection_key: str,
+        subcollection_name: str,
+        note_title: str
+    ) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        Find a note by title in a project subcollection, listing its notes once per run.
+
+        The project subcollection's notes (config, overview, tags, brief, ...)
+        are fetched on first use and indexed by title, so each note's HTML is
+        parsed once per listing. A title missing from the memoized index
+        triggers one refetch in case the note was created since.
+
+        Args:
+            collection_key: Parent collection key
+            subcollection_name: Project subcollection name
+            note_title: Note title to search for
+
+        Returns:
+            Tuple of (subcollection key or None if missing, note or None)
+        """
+        # Found notes are remembered by title (title matching parses every note's HTML)
+        title_key = ('project_note', collection_key, subcollection_name, note_title)
+        if title_key in self._mem:
+            return self._mem[title_key]
+
+        memo_key = ('project_notes', collection_key, subcollection_name)
+
+        def load_notes() -> Tuple[Optional[str], Dict[str, Dict]]:
+            subcollection_key = self.get_subcollection(collection_key, subcollection_name)
+            if not subcollection_key:
+                return None, {}
+            notes_by_title = {}
+            for note in self.get_collection_notes(subcollection_key):
+                title = self.get_note_title(note)
+                notes_by_title.setdefault(title, note)
+            return subcollection_key, notes_by_title
+
+        def find(notes_by_title: Dict[str, Dict]) -> Optional[Dict]:
+            # Exact title first; fall back to the substring match titles allow
+            note = notes_by_title.get(note_title)
+            if note:
+                return note
+            for title, note in notes_by_title.items():
+                if note_title in title:
+                    return note
+            return None
+
+        for attempt in range(2):
+            if attempt:
+                self._mem.pop(memo_key, None)
+            subcollection_key, notes = self._memo(memo_key, load_notes)
+            if not subcollection_key:
+                # Don't remember a missing subcollection (--init-collection may create it)
+                self._mem.pop(memo_key, None)
+                return None, None
+            note = find(notes)
+            if note:
+                self._mem[title_key] = (subcollection_key, note)
+                return subcollection_key, note
+
+        return subcollection_key, None
+
+    def invalidate_note_cache(self, collection_key: str):
+        """
+        Forget memoized project-note listings and lookups for a collection.
+
+        Args:
+            collection_key: Parent collection key
+        """
+        stale = [
+            key for key in self._mem
+            if key[0] in ('project_notes', 'project_note') and key[1] == collection_key
+        ]
+        for key in stale:
+            del self._mem[key]
 
     def get_note_from_subcollection(
         self,
@@ -780,24 +1567,17 @@ vector_embedding_model=all-MiniLM-L6-v2
         """
         subcollection_name = self._get_subcollection_name()
 
-        # Get project-specific subcollection
-        subcollection_key = self.get_subcollection(collection_key, subcollection_name)
+        # Find note by title in the project-specific subcollection
+        subcollection_key, note = self._find_project_note(
+            collection_key, subcollection_name, note_title
+        )
         if not subcollection_key:
             raise FileNotFoundError(
                 f"{subcollection_name} subcollection not found. "
                 f"Run --init-collection --project \"{self.project_name}\" first."
             )
 
-        # Get all notes in subcollection
-        notes = self.get_collection_notes(subcollection_key)
-
-        # Find note by title
-        for note in notes:
-            title = self.get_note_title_from_html(note['data']['note'])
-            if note_title in title:
-                return note
-
-        return None
+        return note
 
     def get_items_to_process(
         self,
@@ -821,14 +1601,23 @@ vector_embedding_model=all-MiniLM-L6-v2
         """
         # If no subcollection filtering, return all items from collection
         if not subcollections:
-            return self.get_collection_items(collection_key)
+            items = self.get_collection_items(collection_key)
+            self.prefetch_item_children([item['key'] for item in items], collection_key)
+            return items
+
+        # Use the local cache for subcollections and their items once synced
+        cache = self._get_cache(collection_key)
+        use_cache = cache is not None and cache.is_synced()
 
         # Get all subcollections of the parent collection
-        try:
-            all_subcollections = self.zot.collections_sub(collection_key)
-        except Exception as e:
-            print(f"  ❌ Error fetching subcollections: {e}")
-            return []
+        if use_cache:
+            all_subcollections = cache.get_subcollections(collection_key)
+        else:
+            try:
+                all_subcollections = self.zot.collections_sub(collection_key)
+            except Exception as e:
+                print(f"  ❌ Error fetching subcollections: {e}")
+                return []
 
         # Build map of subcollection names to keys
         subcollection_map = {}
@@ -838,10 +1627,8 @@ vector_embedding_model=all-MiniLM-L6-v2
             subcollection_map[subcoll_name] = subcoll_key
 
         # Exclude the ZResearcher project subcollection if it exists
-        if self.project_name:
-            zresearcher_subcoll_name = self._get_subcollection_name()
-            if zresearcher_subcoll_name in subcollection_map:
-                del subcollection_map[zresearcher_subcoll_name]
+        if self._subcollection_name:
+            subcollection_map.pop(self._subcollection_name, None)
 
         # Determine which subcollections to include
         target_subcollection_keys = set()
@@ -849,64 +1636,101 @@ vector_embedding_model=all-MiniLM-L6-v2
         if subcollections.lower() == "all":
             # Include all subcollections (except ZResearcher project subcollection)
             target_subcollection_keys = set(subcollection_map.values())
+            target_names = list(subcollection_map)
             if self.verbose:
                 print(f"  📁 Filtering to all subcollections ({len(target_subcollection_keys)} total)")
         else:
             # Parse comma-separated list
-            requested_names = [name.strip() for name in subcollections.split(',')]
-            for name in requested_names:
-                if name not in subcollection_map:
-                    available = ', '.join(f'"{n}"' for n in sorted(subcollection_map.keys()))
-                    raise ValueError(
-                        f"Subcollection '{name}' not found. "
-                        f"Available subcollections: {available}"
-                    )
-                target_subcollection_keys.add(subcollection_map[name])
+            # (order-preserving dedup, so "A,A,B" fetches A once)
+            requested_names = list(dict.fromkeys(
+                name for name in (n.strip() for n in subcollections.split(',')) if name
+            ))
+            missing = set(requested_names) - subcollection_map.keys()
+            if missing:
+                missing_list = ', '.join(f"'{n}'" for n in sorted(missing))
+                available = _format_available_subcollections(tuple(sorted(subcollection_map)))
+                raise ValueError(
+                    f"Subcollection {missing_list} not found. "
+                    f"Available subcollections: {available}"
+                )
+            target_subcollection_keys.update(subcollection_map[name] for name in requested_names)
+            target_names = requested_names
 
             if self.verbose:
                 print(f"  📁 Filtering to subcollections: {', '.join(requested_names)}")
 
+        # Nothing selected and no main-collection pass: skip every fetch
+        if not target_subcollection_keys and not include_main:
+            if self.verbose:
+                print(f"  ✅ Found 0 items after subcollection filtering")
+            return []
+
         # Get items from target subcollections
         filtered_items = []
         seen_keys = set()  # Track items to avoid duplicates
 
-        # Get items from each target subcollection
-        for subcoll_key in target_subcollection_keys:
-            try:
-                # Use everything() to handle pagination and fetch all items (no 100-item limit)
-                subcoll_items = self.zot.everything(self.zot.collection_items_top(subcoll_key))
-                for item in subcoll_items:
-                    item_key = item['key']
-                    if item_key not in seen_keys:
-                        filtered_items.append(item)
-                        seen_keys.add(item_key)
-            except Exception as e:
-                print(f"  ⚠️  Error fetching items from subcollection: {e}")
+        if use_cache:
+            # Single query resolves subcollection names and returns deduplicated items
+            filtered_items = cache.get_subcollection_items(collection_key, target_names)
+            seen_keys = {sys.intern(item['key']) for item in filtered_items}
+        elif target_subcollection_keys:
+            def fetch_subcollection(subcoll_key: str) -> List[Dict]:
+                return [
+                    item
+                    for page in self._iter_collection_item_pages(subcoll_key)
+                    for item in page
+                ]
+
+            # Fetch target subcollections concurrently (network-bound; each is
+            # paged on its own pyzotero client, see _iter_collection_item_pages);
+            # merge on this thread in submission order so no locking is needed
+            workers = min(self.max_workers, len(target_subcollection_keys))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(fetch_subcollection, subcoll_key)
+                    for subcoll_key in target_subcollection_keys
+                ]
+                for future in futures:
+                    try:
+                        subcoll_items = future.result()
+                    except Exception as e:
+                        print(f"  ⚠️  Error fetching items from subcollection: {e}")
+                        continue
+
+                    _dedup_extend(filtered_items, seen_keys, subcoll_items)
 
         # If include_main=True, also get items from main collection that are NOT in any subcollection
         if include_main:
             try:
-                main_items = self.get_collection_items(collection_key)
-                for item in main_items:
-                    item_key = item['key']
-                    item_collections = item['data'].get('collections', [])
-
-                    # Check if item is in main collection only (not in any subcollection)
-                    in_any_subcollection = any(
-                        coll_key in subcollection_map.values()
-                        for coll_key in item_collections
+                # Streamed page by page: main items are filtered and merged as
+                # they arrive rather than after the whole listing downloads
+                main_items = self.iter_collection_items(collection_key)
+
+                # Add items in the main collection only (not in any subcollection);
+                # with no subcollections every main item qualifies
+                if subcollection_map:
+                    if len(target_subcollection_keys) == len(subcollection_map):
+                        # "all" (or every name listed): the target set is the full set
+                        subcollection_keys = target_subcollection_keys
+                    else:
+                        subcollection_keys = frozenset(subcollection_map.values())
+                    main_items = (
+                        item for item in main_items
+                        if subcollection_keys.isdisjoint(item['data'].get('collections') or ())
                     )
-
-                    # Add if not already seen and not in any subcollection
-                    if item_key not in seen_keys and not in_any_subcollection:
-                        filtered_items.append(item)
-                        seen_keys.add(item_key)
+                _dedup_extend(filtered_items, seen_keys, main_items)
             except Exception as e:
-                print(f"  ⚠️  Error fetching items from main collection: {e}")
+                # Raised mid-listing too (see iter_collection_items): items merged
+                # so far are kept, but the main collection was only partly read
+                print(f"  ⚠️  Error fetching items from main collection "
+                      f"({len(seen_keys)} items collected so far, listing incomplete): {e}")
 
         if self.verbose:
             print(f"  ✅ Found {len(filtered_items)} items after subcollection filtering")
 
+        # Per-item summary-note and attachment lookups follow
+        self.prefetch_item_children(list(seen_keys), collection_key)
+
         return filtered_items
 
     def load_note_from_subcollection(
@@ -954,7 +1778,7 @@ vector_embedding_model=all-MiniLM-L6-v2
         content = self.extract_text_from_note_html(note['data']['note'])
 
         # Check for template placeholder
-        if check_todo and '[TODO:' in content:
+        if check_todo and _TEMPLATE_PLACEHOLDER_RE.search(content):
             error_msg = f"{note_title} still contains template. "
             error_msg += "Please edit the note in Zotero"
             if operation_name:
@@ -962,15 +1786,17 @@ vector_embedding_model=all-MiniLM-L6-v2
             error_msg += "."
             raise ValueError(error_msg)
 
-        # Remove footer separator if present
-        if remove_footer and '---' in content:
-            content = content.split('---')[0]
+        # Remove footer separator if present (everything after the first '---')
+        if remove_footer:
+            head, separator, _ = content.partition('---')
+            if separator:
+                content = head
 
         # Remove title line if present
         if remove_title_line:
-            lines = content.split('\n')
-            if lines and note_title in lines[0]:
-                content = '\n'.join(lines[1:])
+            first_line, _, rest = content.partition('\n')
+            if note_title in first_line:
+                content = rest
 
         return content.strip()
 
@@ -1004,8 +1830,9 @@ vector_embedding_model=all-MiniLM-L6-v2
 
         # Convert to HTML
         if preserve_formatting:
-            # Wrap in code block to preserve formatting
-            updated_html = self.markdown_to_html(f"```\n{new_content}\n```")
+            # Wrap in code block to preserve formatting (built directly; this is
+            # the HTML markdown's fenced-code output, without the parse)
+            updated_html = f"<pre><code>{html.escape(new_content, quote=False)}\n</code></pre>"
         else:
             updated_html = self.markdown_to_html(new_content)
 
@@ -1013,5 +1840,79 @@ vector_embedding_model=all-MiniLM-L6-v2
         note['data']['note'] = updated_html
         self.zot.update_item(note)
 
+        # The memoized listing and lookups now hold a stale note version
+        self.invalidate_note_cache(collection_key)
+
         if self.verbose:
             print(f"  ✅ Updated {note_title}")
+
+
+# Extraction-only researcher used by _extract_attachment_worker in pool processes
+_worker_extractor: Optional[ZoteroResearcherBase] = None
+
+
+def _extraction_mp_context():
+    """
+    Get the process start method for extract_items_parallel's pool.
+
+    Its workers start while attachment download threads are running, and a
+    child forked from a multi-threaded process can inherit a lock held by
+    one of those threads and deadlock. Workers are started from a fork
+    server where available (POSIX), or spawned.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _init_extraction_worker(
+    verbose: bool,
+    skip_scanned_pages: bool,
+    preserve_reading_order: bool,
+    html_extractor_chain: List[str]
+):
+    """
+    Set up a process-pool worker for extract_items_parallel.
+
+    The extract_text_from_* methods only read extraction settings, so the
+    worker builds a bare instance (no Zotero or Anthropic clients) instead of
+    pickling the parent's.
+
+    Args:
+        verbose: Parent's verbose flag
+        skip_scanned_pages: Parent's skip_scanned_pages setting
+        preserve_reading_order: Parent's preserve_reading_order setting
+        html_extractor_chain: Parent's html_extractor_chain setting
+    """
+    global _worker_extractor
+    extractor = ZoteroResearcherBase.__new__(ZoteroResearcherBase)
+    extractor.verbose = verbose
+    extractor.skip_scanned_pages = skip_scanned_pages
+    extractor.preserve_reading_order = preserve_reading_order
+    extractor.html_extractor_chain = html_extractor_chain
+    extractor.max_workers = 1  # Already in a pool; don't nest another for long PDFs
+    extractor._mem = {}  # Per-process URL memo (see _extract_url_main_text)
+    _worker_extractor = extractor
+
+
+def _extract_attachment_worker(
+    content_type: str,
+    content: bytes,
+    attachment_url: Optional[str],
+    char_limit: Optional[int]
+) -> Optional[str]:
+    """
+    Extract text from downloaded attachment bytes (process-pool worker).
+
+    Args:
+        content_type: "HTML", "PDF", "DOCX" or "TXT"
+        content: Attachment file content as bytes
+        attachment_url: Attachment URL (HTML fallback fetch)
+        char_limit: Optional character budget for PDF extraction
+
+    Returns:
+        Extracted text, or None if extraction failed
+    """
+    return _worker_extractor._extract_attachment_text(
+        content_type, content, attachment_url, char_limit
+    )
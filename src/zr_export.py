@@ -341,7 +341,7 @@ class ZoteroNotebookLMExporter(ZoteroResearcherBase):
                     if child_data.get('itemType') == 'note':
                         note_html = child_data.get('note', '')
                         # Check if this is the summary note for our project
-                        note_title = self.get_note_title_from_html(note_html)
+                        note_title = self.get_note_title(child)
                         if summary_note_prefix in note_title:
                             # Extract the text content (markdown format)
                             note_text = self.extract_text_from_note_html(note_html)
@@ -830,7 +830,7 @@ class ZoteroNotebookLMExporter(ZoteroResearcherBase):
                 children = self.zot.children(item['key'])
                 has_summary = any(
                     child['data'].get('itemType') == 'note' and
-                    summary_note_prefix in self.get_note_title_from_html(child['data'].get('note', ''))
+                    summary_note_prefix in self.get_note_title(child)
                     for child in children
                 )
                 if not has_summary:
@@ -965,7 +965,7 @@ collection: {collection_name}
                     for child in children:
                         if child['data'].get('itemType') == 'note':
                             note_html = child['data'].get('note', '')
-                            note_title = self.get_note_title_from_html(note_html)
+                            note_title = self.get_note_title(child)
                             if summary_note_prefix in note_title:
                                 summary_content = self.extract_text_from_note_html(note_html)
                                 frontmatter['has_summary'] = True
@@ -977,7 +977,7 @@ collection: {collection_name}
                 for child in children:
                     if child['data'].get('itemType') == 'note':
                         note_html = child['data'].get('note', '')
-                        note_title = self.get_note_title_from_html(note_html)
+                        note_title = self.get_note_title(child)
                         # Skip ZResearcher notes
                         if '【' not in note_title:
                             note_text = self.extract_text_from_note_html(note_html)
@@ -1134,7 +1134,7 @@ collection: {collection_name}
                 project_overview_title = self._get_project_overview_note_title()
                 for note in notes:
                     note_html = note['data'].get('note', '')
-                    note_title = self.get_note_title_from_html(note_html)
+                    note_title = self.get_note_title(note)
                     if project_overview_title in note_title:
                         project_brief = self.extract_text_from_note_html(note_html)
                         break
@@ -1161,7 +1161,7 @@ collection: {collection_name}
             for child in children:
                 if child['data'].get('itemType') == 'note':
                     note_html = child['data'].get('note', '')
-                    note_title = self.get_note_title_from_html(note_html)
+                    note_title = self.get_note_title(child)
                     if summary_note_prefix in note_title:
                         summary_content = self.extract_text_from_note_html(note_html)
                         break
@@ -1272,10 +1272,14 @@ collection: {collection_name}
         # Phase 3: Export full content (optional)
         if include_full_content:
             print(f"\nPhase 3: Exporting full content...")
+            # Download all attachments concurrently and parse them across processes
+            contents = self.extract_items_parallel(
+                [source['item'] for source in sources_with_summaries]
+            )
             for idx, source in enumerate(sources_with_summaries, 1):
                 print(f"  [{idx}/{len(sources_with_summaries)}] {source['title'][:50]}")
 
-                content, content_type = self.get_source_content(source['item'])
+                content, content_type = contents[source['item']['key']]
                 if content:
                     filename = f"{source['item_key']}.md"
                     filepath = content_path / filename
@@ -339,10 +339,7 @@ class ZoteroFileSearcher(ZoteroResearcherBase):
                 attachment_key = attachment['key']
 
                 # Check if compatible file type
-                if not (self.is_pdf_attachment(attachment) or
-                       self.is_html_attachment(attachment) or
-                       self.is_docx_attachment(attachment) or
-                       self.is_txt_attachment(attachment)):
+                if not self.classify_attachment(attachment):
                     continue
 
                 print(f"  📄 Found attachment: {attachment_title}")
@@ -284,18 +284,20 @@ Edit this note before running --file-search"""
 
             # Check for sources with summaries
             try:
-                items = self.get_collection_items(collection_key)
-                summaries_count = 0
+                columns = self.get_collection_item_columns(collection_key)
+                source_keys = [
+                    key for key, item_type in zip(columns['keys'], columns['item_types'])
+                    if item_type not in ('attachment', 'note')
+                ]
                 summary_prefix = f"【ZResearcher Summary: {project['name']}】"
 
-                for item in items:
-                    item_type = item['data'].get('itemType')
-                    if item_type in ['attachment', 'note']:
-                        continue
-                    if self.has_note_with_prefix(item['key'], summary_prefix, collection_key):
-                        summaries_count += 1
+                self.prefetch_item_children(source_keys, collection_key)
+                summaries_count = sum(
+                    1 for item_key in source_keys
+                    if self.has_note_with_prefix(item_key, summary_prefix, collection_key)
+                )
 
-                print(f"   Sources with summaries: {summaries_count}/{len([i for i in items if i['data'].get('itemType') not in ['attachment', 'note']])}")
+                print(f"   Sources with summaries: {summaries_count}/{len(source_keys)}")
             except Exception:
                 print(f"   Sources with summaries: Unable to count")
 
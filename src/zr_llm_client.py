@@ -6,10 +6,11 @@ Handles both single and batch API calls with consistent error handling,
 rate limiting, and progress tracking.
 """
 
+import asyncio
 import time
 from typing import Optional, Dict, List, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 
 class ZRLLMClient:
@@ -24,11 +25,16 @@ class ZRLLMClient:
     - Model selection
     """
 
+    # Consecutive failed status checks (or result reads) before a message
+    # batch is given up on
+    BATCH_MAX_POLL_FAILURES = 5
+
     def __init__(
         self,
         anthropic_client: Anthropic,
         default_model: str = 'claude-haiku-4-5-20251001',
-        verbose: bool = False
+        verbose: bool = False,
+        async_client_factory: Optional[Callable[[], AsyncAnthropic]] = None
     ):
         """
         Initialize the LLM client.
@@ -37,10 +43,14 @@ class ZRLLMClient:
             anthropic_client: Initialized Anthropic client
             default_model: Default model to use if not specified per call
             verbose: If True, show detailed debug information
+            async_client_factory: Optional callable returning a new AsyncAnthropic
+                client; when set, call_batch runs requests on an asyncio event
+                loop instead of a thread pool
         """
         self.client = anthropic_client
         self.default_model = default_model
         self.verbose = verbose
+        self.async_client_factory = async_client_factory
 
     def call(
         self,
@@ -83,6 +93,100 @@ class ZRLLMClient:
                 print(f"\n  ❌ LLM call error ({type(e).__name__}): {e}")
             return None
 
+    async def acall(
+        self,
+        client: AsyncAnthropic,
+        prompt: str,
+        max_tokens: int = 1000,
+        model: Optional[str] = None,
+        temperature: float = 1.0
+    ) -> Optional[str]:
+        """
+        Make a single asynchronous LLM API call (async counterpart of call()).
+
+        Args:
+            client: AsyncAnthropic client bound to the running event loop
+            prompt: The prompt to send
+            max_tokens: Maximum tokens in response
+            model: Model to use (overrides default)
+            temperature: Temperature for sampling (0.0-1.0)
+
+        Returns:
+            Response text, or None if call fails
+        """
+        try:
+            response = await client.messages.create(
+                model=model or self.default_model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+
+            if response.content and len(response.content) > 0:
+                return response.content[0].text.strip()
+            else:
+                if self.verbose:
+                    print(f"\n  ⚠️  Empty response from LLM (response.content was empty)")
+                return None
+
+        except Exception as e:
+            if self.verbose:
+                print(f"\n  ❌ LLM call error ({type(e).__name__}): {e}")
+            return None
+
+    async def _acall_batch(
+        self,
+        requests: List[Dict],
+        max_workers: int,
+        rate_limit_delay: float,
+        progress_callback: Optional[Callable]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Run requests concurrently on one event loop, at most max_workers in flight.
+
+        Args:
+            requests: List of request dicts (same format as call_batch)
+            max_workers: Maximum concurrent requests
+            rate_limit_delay: Delay in seconds between request starts
+            progress_callback: Optional callback(completed, total)
+
+        Returns:
+            Dict mapping request IDs to responses: {id: response_text or None}
+        """
+        results = {}
+        total = len(requests)
+        completed = 0
+        semaphore = asyncio.Semaphore(max_workers)
+
+        # A fresh client per loop: httpx connection pools can't outlive their loop
+        async with self.async_client_factory() as client:
+
+            async def run(index: int, request: Dict) -> None:
+                nonlocal completed
+
+                # Stagger starts the same way call_batch spaces submissions
+                if rate_limit_delay > 0:
+                    await asyncio.sleep(index * rate_limit_delay)
+
+                async with semaphore:
+                    results[request['id']] = await self.acall(
+                        client,
+                        prompt=request['prompt'],
+                        max_tokens=request.get('max_tokens', 1000),
+                        model=request.get('model'),
+                        temperature=request.get('temperature', 1.0)
+                    )
+
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total)
+
+            await asyncio.gather(*(run(index, request) for index, request in enumerate(requests)))
+
+        return results
+
     def call_batch(
         self,
         requests: List[Dict],
@@ -91,7 +195,10 @@ class ZRLLMClient:
         progress_callback: Optional[Callable] = None
     ) -> Dict[str, Optional[str]]:
         """
-        Make multiple LLM API calls in parallel using ThreadPoolExecutor.
+        Make multiple LLM API calls in parallel.
+
+        Uses asyncio with an AsyncAnthropic client when async_client_factory is
+        set, otherwise a ThreadPoolExecutor.
 
         Args:
             requests: List of request dicts with keys:
@@ -100,13 +207,19 @@ class ZRLLMClient:
                 - 'max_tokens': Maximum tokens in response (default: 1000)
                 - 'model': Model to use (optional, uses default if not specified)
                 - 'temperature': Temperature (optional, default: 1.0)
-            max_workers: Number of concurrent threads (default: 10)
+            max_workers: Maximum concurrent requests (default: 10)
             rate_limit_delay: Delay in seconds between request submissions (default: 0.1)
             progress_callback: Optional callback(completed, total) called after each completion
 
         Returns:
             Dict mapping request IDs to responses: {id: response_text or None}
         """
+        # Prefer one event loop over a thread pool when an async client is available
+        if self.async_client_factory is not None:
+            return asyncio.run(self._acall_batch(
+                requests, max_workers, rate_limit_delay, progress_callback
+            ))
+
         results = {}
         total = len(requests)
         completed = 0
@@ -148,13 +261,119 @@ class ZRLLMClient:
 
         return results
 
+    def call_message_batch(
+        self,
+        requests: List[Dict],
+        poll_interval: float = 10.0,
+        progress_callback: Optional[Callable] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Submit requests as one Anthropic Message Batch and wait for the results.
+
+        Batches are billed at a discount and replace one HTTP request per prompt
+        with a single submission, at the cost of asynchronous processing (results
+        may take minutes to arrive).
+
+        Args:
+            requests: List of request dicts (same format as call_batch); each 'id'
+                is used as the batch custom_id and must be 1-64 chars of [A-Za-z0-9_-]
+            poll_interval: Seconds between status checks
+            progress_callback: Optional callback(completed, total) called when the
+                number of finished requests changes
+
+        Returns:
+            Dict mapping the IDs of requests that succeeded in the batch to their
+            responses ({id: response_text or None}); requests that errored,
+            expired or whose results could not be read are left out, so callers
+            can rerun just those
+
+        Raises:
+            Exception: If the batch cannot be created (callers may fall back to call_batch)
+        """
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    'custom_id': request['id'],
+                    'params': {
+                        'model': request.get('model') or self.default_model,
+                        'max_tokens': request.get('max_tokens', 1000),
+                        'temperature': request.get('temperature', 1.0),
+                        'messages': [
+                            {"role": "user", "content": request['prompt']}
+                        ]
+                    }
+                }
+                for request in requests
+            ]
+        )
+
+        if self.verbose:
+            print(f"\n  📦 Submitted message batch {batch.id} ({len(requests)} requests)")
+
+        # Poll until every request has finished. The batch keeps running (and
+        # billing) regardless of what happens here, so failed status checks are
+        # retried; if the batch can't be reached at all it is cancelled.
+        total = len(requests)
+        last_completed = -1
+        failures = 0
+        while batch.processing_status != 'ended':
+            counts = batch.request_counts
+            completed = counts.succeeded + counts.errored + counts.canceled + counts.expired
+            if progress_callback and completed != last_completed:
+                progress_callback(completed, total)
+                last_completed = completed
+            time.sleep(poll_interval)
+            try:
+                batch = self.client.messages.batches.retrieve(batch.id)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                if failures < self.BATCH_MAX_POLL_FAILURES:
+                    if self.verbose:
+                        print(f"\n  ⚠️  Status check for batch {batch.id} failed ({e}), retrying")
+                    continue
+                print(f"\n  ⚠️  Lost track of message batch {batch.id} ({type(e).__name__}: {e}), cancelling it")
+                try:
+                    self.client.messages.batches.cancel(batch.id)
+                except Exception:
+                    pass
+                return {}
+
+        if progress_callback:
+            progress_callback(total, total)
+
+        # Collect results (a failed read is retried; entries already read are kept)
+        results = {}
+        for attempt in range(self.BATCH_MAX_POLL_FAILURES):
+            try:
+                for entry in self.client.messages.batches.results(batch.id):
+                    if entry.result.type == 'succeeded':
+                        message = entry.result.message
+                        if message.content and len(message.content) > 0:
+                            results[entry.custom_id] = message.content[0].text.strip()
+                        else:
+                            results[entry.custom_id] = None
+                            if self.verbose:
+                                print(f"\n  ⚠️  Empty response from LLM for {entry.custom_id}")
+                    elif self.verbose:
+                        print(f"\n  ❌ Batch request {entry.custom_id} {entry.result.type}")
+                break
+            except Exception as e:
+                if attempt + 1 == self.BATCH_MAX_POLL_FAILURES:
+                    print(f"\n  ⚠️  Could not read all results of batch {batch.id} ({type(e).__name__}: {e})")
+                else:
+                    time.sleep(poll_interval)
+
+        return results
+
     def call_batch_with_parsing(
         self,
         requests: List[Dict],
         parser: Callable[[str], Optional[Dict]],
         max_workers: int = 10,
         rate_limit_delay: float = 0.1,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        use_message_batches: bool = False
     ) -> Dict[str, Optional[Dict]]:
         """
         Make batch calls and parse responses with a custom parser function.
@@ -165,17 +384,37 @@ class ZRLLMClient:
             max_workers: Number of concurrent threads
             rate_limit_delay: Delay between request submissions
             progress_callback: Optional callback(completed, total)
+            use_message_batches: If True, submit via the Message Batches API
+                (falls back to parallel calls if the batch cannot be created,
+                and for requests the batch did not complete)
 
         Returns:
             Dict mapping request IDs to parsed results: {id: parsed_dict or None}
         """
         # Get raw responses
-        raw_results = self.call_batch(
-            requests,
-            max_workers=max_workers,
-            rate_limit_delay=rate_limit_delay,
-            progress_callback=progress_callback
-        )
+        raw_results = {}
+        pending = requests
+        if use_message_batches:
+            try:
+                raw_results = self.call_message_batch(
+                    requests,
+                    progress_callback=progress_callback
+                )
+            except Exception as e:
+                print(f"\n  ⚠️  Message batch failed ({type(e).__name__}: {e}), using parallel calls")
+            else:
+                # Only rerun what the batch didn't complete (succeeded requests are billed)
+                pending = [request for request in requests if request['id'] not in raw_results]
+                if pending:
+                    print(f"\n  ⚠️  {len(pending)} batch requests did not complete, using parallel calls")
+
+        if pending:
+            raw_results.update(self.call_batch(
+                pending,
+                max_workers=max_workers,
+                rate_limit_delay=rate_limit_delay,
+                progress_callback=progress_callback
+            ))
 
         # Parse each response
         parsed_results = {}
@@ -191,14 +191,8 @@ class ZoteroResearcherOrganizer(ZoteroResearcherBase):
         """
         attachments = self.get_item_attachments(item_key)
 
-        for attachment in attachments:
-            if (self.is_html_attachment(attachment) or
-                self.is_pdf_attachment(attachment) or
-                self.is_docx_attachment(attachment) or
-                self.is_txt_attachment(attachment)):
-                return True
-
-        return False
+        # classify_attachment checks all four types in one lookup per attachment
+        return any(self.classify_attachment(attachment) for attachment in attachments)
 
     def promote_attachment_to_parent(self, attachment_item: Dict) -> Optional[str]:
         """
@@ -5,6 +5,8 @@ This module contains all major LLM prompts used by the zresearcher.py module.
 Edit these templates directly to customize the research assistant behavior.
 """
 
+from typing import Dict, List
+
 
 def general_summary_prompt(
     project_overview: str,
@@ -149,6 +151,34 @@ KEY_CLAIMS:
 """
 
 
+# Shared 0-10 relevance scoring rubric (single-source and batched prompts)
+_RELEVANCE_RUBRIC = """Scoring Rubric (compute 0–10, round to nearest integer, then apply the bonus rule below; cap at 10):
+1) Topical Alignment (0–5) — Does the SOURCE directly address the BRIEF’s research question/scope?
+   0–1: tangential/mostly off-topic
+   2–3: partially related; covers some aspects
+   4: strongly related; substantial overlap
+   5: directly on-point and central
+   Use the Tags to refine alignment: overlapping tags with BRIEF keywords → stronger alignment; contradictory/orthogonal tags → weaker.
+
+2) Credibility & Source Type (0–3) — Trustworthiness/authoritativeness.
+   3: primary/official sources (government/statistical agencies, legislation, ministerial speeches/transcripts, audited administrative datasets) OR peer-reviewed studies/standards bodies
+   2: reputable think tanks, established news with transparent methods/sourcing, named experts with citations
+   1: mixed/unclear sourcing; lightly referenced blogs
+   0: anonymous, unsourced, promotional, or unverifiable
+   Tags indicating "government", "official statistics", "legislation", "ministerial speech", "dataset" should strengthen this category.
+
+3) Timeliness / Temporal Fit (0–1) — Recency or correct historical window for the topic.
+   1: timely for a fast-moving topic OR clearly within the required time period
+   0: dated/mismatched timeframe
+
+4) Utility & Specificity (0–1) — Actionable content (methods, data tables, case studies, concrete findings).
+   1: offers directly usable specifics
+   0: generic commentary only
+
+Bonus Rule (apply after summing 0–10, then cap at 10):
++1 if the BRIEF explicitly asks for quantitative figures/data and the SOURCE contains directly usable quantitative evidence (e.g., tables/datasets/clear methods/statistics). Cap the final score at 10."""
+
+
 def relevance_evaluation_prompt(
     research_brief: str,
     title: str,
@@ -183,31 +213,7 @@ Output Rules (STRICT):
 - If you cannot evaluate (e.g., empty text, wrong language, corrupted), output 0.
 - Your output must match this regex: ^([0-9]|10)$
 
-Scoring Rubric (compute 0–10, round to nearest integer, then apply the bonus rule below; cap at 10):
-1) Topical Alignment (0–5) — Does the SOURCE directly address the BRIEF’s research question/scope?
-   0–1: tangential/mostly off-topic
-   2–3: partially related; covers some aspects
-   4: strongly related; substantial overlap
-   5: directly on-point and central
-   Use the Tags to refine alignment: overlapping tags with BRIEF keywords → stronger alignment; contradictory/orthogonal tags → weaker.
-
-2) Credibility & Source Type (0–3) — Trustworthiness/authoritativeness.
-   3: primary/official sources (government/statistical agencies, legislation, ministerial speeches/transcripts, audited administrative datasets) OR peer-reviewed studies/standards bodies
-   2: reputable think tanks, established news with transparent methods/sourcing, named experts with citations
-   1: mixed/unclear sourcing; lightly referenced blogs
-   0: anonymous, unsourced, promotional, or unverifiable
-   Tags indicating "government", "official statistics", "legislation", "ministerial speech", "dataset" should strengthen this category.
-
-3) Timeliness / Temporal Fit (0–1) — Recency or correct historical window for the topic.
-   1: timely for a fast-moving topic OR clearly within the required time period
-   0: dated/mismatched timeframe
-
-4) Utility & Specificity (0–1) — Actionable content (methods, data tables, case studies, concrete findings).
-   1: offers directly usable specifics
-   0: generic commentary only
-
-Bonus Rule (apply after summing 0–10, then cap at 10):
-+1 if the BRIEF explicitly asks for quantitative figures/data and the SOURCE contains directly usable quantitative evidence (e.g., tables/datasets/clear methods/statistics). Cap the final score at 10.
+{_RELEVANCE_RUBRIC}
 
 Research Brief:
 {research_brief}
@@ -225,6 +231,55 @@ Source Summary:
 
 
 
+def batch_relevance_evaluation_prompt(
+    research_brief: str,
+    sources: List[Dict[str, str]]
+) -> str:
+    """
+    Prompt for evaluating several sources' relevance in one request.
+
+    Used in Phase 2 (query) when relevance_batch_size > 1. Applies the same
+    rubric as relevance_evaluation_prompt() to each numbered source.
+
+    Args:
+        research_brief: Research question/brief
+        sources: Source dicts with keys title, authors, date, doc_type, tags,
+            summary (numbered 1..N in the prompt, in list order)
+
+    Returns:
+        Formatted prompt string
+    """
+    source_blocks = "\n\n".join(
+        f"""=== SOURCE {number} ===
+Source Metadata:
+- Title: {source['title']}
+- Authors: {source['authors']}
+- Date: {source['date']}
+- Type: {source['doc_type']}
+- Tags: {source['tags']}
+
+Source Summary:
+{source['summary']}"""
+        for number, source in enumerate(sources, 1)
+    )
+
+    return f"""You are a meticulous relevance rater. Read the RESEARCH BRIEF and each numbered SOURCE (metadata + summary), then rate how relevant each SOURCE is to the BRIEF. Rate every source independently.
+
+Output Rules (STRICT):
+- Return ONLY a JSON array with exactly {len(sources)} objects, one per source, in source order.
+- Each object must be {{"id": <source number>, "score": <integer 0-10>}}.
+- No words, no explanation, no markdown code fences.
+- If you cannot evaluate a source (e.g., empty text, wrong language, corrupted), give it score 0.
+
+{_RELEVANCE_RUBRIC}
+
+Research Brief:
+{research_brief}
+
+{source_blocks}
+"""
+
+
 def targeted_summary_prompt(
     research_brief: str,
     title: str,
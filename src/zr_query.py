@@ -5,7 +5,9 @@ ZoteroResearcher Query Module
 Handles Phase 2: Querying sources with research briefs and generating reports.
 """
 
+import json
 import os
+import re
 import time
 import markdown
 from typing import Optional, Dict, List
@@ -554,11 +556,16 @@ Respond with ONLY the title, nothing else. No quotes, no punctuation at the end.
             if len(tags) > 3:
                 tags_display += f", +{len(tags)-3} more"
 
-            # Get full content for detailed summary generation later
-            content, content_type = self.get_source_content(item)
+            # Get content for detailed summary generation later (only the part
+            # that survives truncation is needed)
+            content, content_type = self.get_source_content(
+                item, char_limit=self.TARGETED_SUMMARY_CHAR_LIMIT
+            )
 
             print(f"[{idx}/{len(items)}] ✅ {item_title} - {metadata.get('type', 'Unknown')} | Tags: {tags_display}")
 
+            # Keep only the part sent to the LLM; the full text is dropped here
+            content = content if content else summary
             items_with_summaries.append({
                 'item': item,
                 'item_key': item_key,
@@ -566,31 +573,58 @@ Respond with ONLY the title, nothing else. No quotes, no punctuation at the end.
                 'metadata': metadata,
                 'tags': tags,
                 'summary': summary,
-                'content': content if content else summary,
+                'content': content[:self.TARGETED_SUMMARY_CHAR_LIMIT],
+                'content_len': len(content),
                 'content_type': content_type if content else metadata.get('type', 'Unknown')
             })
 
         # Step 1.2: Build batch requests for relevance evaluation
-        print(f"\nStep 1.2: Building {len(items_with_summaries)} relevance evaluation requests...")
+        # (relevance_batch_size sources are packed into each request)
+        batch_size = self.relevance_batch_size
+        item_groups = [
+            items_with_summaries[start:start + batch_size]
+            for start in range(0, len(items_with_summaries), batch_size)
+        ]
+        print(f"\nStep 1.2: Building {len(item_groups)} relevance evaluation requests "
+              f"for {len(items_with_summaries)} sources...")
 
         batch_requests = []
-        for item_data in items_with_summaries:
-            tags_str = ', '.join(item_data['tags']) if item_data['tags'] else 'None'
+        for group_idx, group in enumerate(item_groups):
+            sources = []
+            for item_data in group:
+                tags_str = ', '.join(item_data['tags']) if item_data['tags'] else 'None'
+                sources.append({
+                    'title': item_data['metadata'].get('title', 'Untitled'),
+                    'authors': item_data['metadata'].get('authors', 'Unknown'),
+                    'date': item_data['metadata'].get('date', 'Unknown'),
+                    'doc_type': item_data['metadata'].get('type', 'Unknown'),
+                    'tags': tags_str,
+                    'summary': item_data['summary'][:10000]
+                })
 
-            prompt = zr_prompts.relevance_evaluation_prompt(
-                research_brief=self.research_brief,
-                title=item_data['metadata'].get('title', 'Untitled'),
-                authors=item_data['metadata'].get('authors', 'Unknown'),
-                date=item_data['metadata'].get('date', 'Unknown'),
-                doc_type=item_data['metadata'].get('type', 'Unknown'),
-                tags=tags_str,
-                summary=item_data['summary'][:10000]
-            )
+            if len(sources) == 1:
+                source = sources[0]
+                prompt = zr_prompts.relevance_evaluation_prompt(
+                    research_brief=self.research_brief,
+                    title=source['title'],
+                    authors=source['authors'],
+                    date=source['date'],
+                    doc_type=source['doc_type'],
+                    tags=source['tags'],
+                    summary=source['summary']
+                )
+                max_tokens = 10
+            else:
+                prompt = zr_prompts.batch_relevance_evaluation_prompt(
+                    research_brief=self.research_brief,
+                    sources=sources
+                )
+                max_tokens = 20 * len(sources) + 20
 
             batch_requests.append({
-                'id': item_data['item_key'],
+                'id': str(group_idx),
                 'prompt': prompt,
-                'max_tokens': 10,
+                'max_tokens': max_tokens,
                 'model': self.haiku_model
             })
 
@@ -605,7 +639,6 @@ Respond with ONLY the title, nothing else. No quotes, no punctuation at the end.
         def parse_relevance_score(response_text: str) -> Optional[int]:
             """Extract relevance score 0-10 from response."""
             try:
-                import re
                 match = re.search(r'^(\d+)', response_text.strip())
                 if not match:
                     match = re.search(r'\b(\d+)\b', response_text)
@@ -616,14 +649,47 @@ Respond with ONLY the title, nothing else. No quotes, no punctuation at the end.
             except Exception:
                 return None
 
-        relevance_results = self.llm_client.call_batch_with_parsing(
+        # Parse packed scores: JSON array of {"id": N, "score": S} (1-based ids).
+        # A plain integer response is returned under id 0, which only
+        # single-source groups accept (see the mapping below)
+        def parse_relevance_scores(response_text: str) -> Optional[Dict[int, int]]:
+            """Extract {source number: score 0-10} from a batched response."""
+            start = response_text.find('[')
+            if start == -1:
+                score = parse_relevance_score(response_text)
+                return {0: score} if score is not None else None
+            try:
+                # Decode just the first array; any text after it is ignored
+                entries, _ = json.JSONDecoder().raw_decode(response_text, start)
+            except json.JSONDecodeError:
+                return None
+            if not isinstance(entries, list):
+                return None
+            scores = {}
+            for entry in entries:
+                try:
+                    scores[int(entry['id'])] = max(0, min(10, int(entry['score'])))
+                except (KeyError, TypeError, ValueError):
+                    continue
+            return scores or None
+
+        group_results = self.llm_client.call_batch_with_parsing(
             requests=batch_requests,
-            parser=parse_relevance_score,
+            parser=parse_relevance_scores,
             max_workers=self.max_workers,
             rate_limit_delay=self.rate_limit_delay,
             progress_callback=progress_callback
         )
 
+        # Map packed scores back to item keys
+        relevance_results = {}
+        for group_idx, group in enumerate(item_groups):
+            scores = group_results.get(str(group_idx)) or {}
+            if len(group) == 1 and 0 in scores:
+                scores = {1: scores[0]}
+            for number, item_data in enumerate(group, 1):
+                relevance_results[item_data['item_key']] = scores.get(number)
+
         print("\n")
 
         # Step 1.4: Combine scores with source data
@@ -642,6 +708,7 @@ Respond with ONLY the title, nothing else. No quotes, no punctuation at the end.
                     'item': item_data['item'],
                     'score': score,
                     'content': item_data['content'],
+                    'content_len': item_data['content_len'],
                     'content_type': item_data['content_type'],
                     'metadata': item_data['metadata'],
                     'tags': item_data['tags']
@@ -682,7 +749,7 @@ Respond with ONLY the title, nothing else. No quotes, no punctuation at the end.
             item_key = item['key']
             content = source_data['content']
             content_type = source_data['content_type']
-            content_len = len(content)
+            content_len = source_data['content_len']
             truncated = content_len > self.TARGETED_SUMMARY_CHAR_LIMIT
 
             if truncated:
@@ -694,7 +761,7 @@ Respond with ONLY the title, nothing else. No quotes, no punctuation at the end.
                 research_brief=self.research_brief,
                 title=item_title,
                 content_type=content_type,
-                content=content[:self.TARGETED_SUMMARY_CHAR_LIMIT],
+                content=content,
                 truncated=truncated,
                 char_limit=self.TARGETED_SUMMARY_CHAR_LIMIT
             )
@@ -90,25 +90,21 @@ class DocumentChunker:
             raise ImportError("PyMuPDF (fitz) is required for PDF chunking")
 
         chunks: List[ChunkData] = []
-        pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
-
         # Extract text from each page with position tracking
         pages: List[PageContent] = []
         char_offset = 0
 
-        for page_num in range(len(pdf_document)):
-            page = pdf_document[page_num]
-            text = page.get_text().strip()
-            if text:
-                pages.append(PageContent(
-                    page_number=page_num + 1,  # 1-indexed
-                    text=text,
-                    char_start=char_offset,
-                    char_end=char_offset + len(text)
-                ))
-                char_offset += len(text) + 2  # Account for separator
-
-        pdf_document.close()
+        with fitz.open(stream=pdf_content, filetype="pdf") as pdf_document:
+            for page in pdf_document:
+                text = page.get_text("text", sort=False).strip()
+                if text:
+                    pages.append(PageContent(
+                        page_number=page.number + 1,  # 1-indexed
+                        text=text,
+                        char_start=char_offset,
+                        char_end=char_offset + len(text)
+                    ))
+                    char_offset += len(text) + 2  # Account for separator
 
         if not pages:
             self._log("PDF contains no extractable text")